@@ -1,5 +1,10 @@
-from .app import create_cuc, convert_from_to, check_version, to, check_reference, go
+from .app import create_cuc, convert_from_to, check_version, to, check_reference, go, \
+    register_sqlite, register_duckdb, register_family, freeze, search_units, register_polars
 from .config import __author__, __version__
+from .docs import Quantity, UnitArray
+from .docs.factors import FactorValidationError
 
 __all__ = ['create_cuc', 'convert_from_to',
-           'check_version', '__author__', '__version__', 'to', 'check_reference', 'go']
+           'check_version', '__author__', '__version__', 'to', 'check_reference', 'go', 'Quantity', 'UnitArray',
+           'register_sqlite', 'register_duckdb', 'register_family', 'freeze', 'search_units',
+           'register_polars', 'FactorValidationError']
@@ -1,7 +1,11 @@
 # import packages/modules
 import os
 # local
-from .docs import CustomUnitConverter, CustomUnitConverterX, Utils
+from .docs import CustomUnitConverterX, Utils, Quantity
+from .docs.cucx import shared_converter
+from .docs.sqlx import register_sqlite, register_duckdb
+from .docs.polarsx import register_polars
+from .docs.frozen import freeze as _freeze
 from .config import __version__
 
 
@@ -28,12 +32,13 @@ def check_reference(reference: str, dataframe=True):
 
     Returns
     -------
-    reference : dict | dataframe
-        reference details
+    reference : MappingProxyType | dataframe
+        reference details (read-only)
 
     Notes
     ------
-    1. The reference can be set to 'PRESSURE', 'TEMPERATURE', 'CUSTOM'
+    1. The reference can be set to 'PRESSURE', 'TEMPERATURE', 'CUSTOM', a custom group ('CUSTOM::ENERGY') or a catalog family.
+    2. Tables of the shared registry are cached until its units change.
 
     Examples
     --------
@@ -49,9 +54,11 @@ def check_reference(reference: str, dataframe=True):
     try:
         # check reference
         if isinstance(reference, str) and len(reference) > 0:
-            cucC = CustomUnitConverter('', '')
+            # custom: the group of units added by add_custom_unit
+            if reference.strip().upper() == 'CUSTOM':
+                reference = 'CUSTOM::CUSTOM'
             # check reference
-            return cucC.check_reference(reference, dataframe)
+            return shared_converter().check_reference(reference, dataframe)
         else:
             raise Exception('Reference not provided!')
 
@@ -59,14 +66,18 @@ def check_reference(reference: str, dataframe=True):
         raise Exception('Checking references failed!, ', e)
 
 
-def go(reference_file=None) -> CustomUnitConverterX:
+def go(reference_file=None, cache_dir=None, max_workers=None) -> CustomUnitConverterX:
     '''
     Initializes app with/without external yml file
 
     Parameters
     ----------
-    reference_file : str, optional
-        The path to the yml reference file
+    reference_file : str | list, optional
+        The path to the yml reference file, or a list of layered reference files
+    cache_dir : str, optional
+        Folder to cache merged layered reference files between runs
+    max_workers : int, optional
+        Processes parsing layered reference files and their includes (default: parse in this process)
 
     Returns
     -------
@@ -77,9 +88,12 @@ def go(reference_file=None) -> CustomUnitConverterX:
     ------
     1. The reference can be set to 'PRESSURE', 'TEMPERATURE', 'CUSTOM'
     2. If reference_file is not None, then the app will load the yml file
+    3. If reference_file is a list, files are merged in order (later files win)
 
     ### yml reference file format is as:
 
+    include:
+        - base-units.yml
     CUSTOM-UNIT:
         HEAT-CAPACITY:
             J/mol.K : 1
@@ -91,18 +105,28 @@ def go(reference_file=None) -> CustomUnitConverterX:
             J/kmol : 1000
             kcal/mol: 0.000239006
             cal/mol: 0.239006
+
+    `include` (optional) lists files loaded before this one, `replace: [GROUP]` (optional) replaces a group instead of merging its units.
     '''
     try:
         # init
         cucxC = CustomUnitConverterX('', '')
         # load external custom unit
         # check
-        if reference_file is not None:
+        if isinstance(reference_file, (list, tuple)):
+            # layers
+            cucxC.load_custom_units(list(reference_file), max_workers=max_workers,
+                                    cache_dir=cache_dir)
+        elif reference_file is not None:
             # check file exists
             if not os.path.exists(reference_file):
                 raise Exception('File not found!')
             # load
-            cucxC.load_custom_unit(reference_file)
+            if max_workers or cache_dir:
+                cucxC.load_custom_units([reference_file], max_workers=max_workers,
+                                        cache_dir=cache_dir)
+            else:
+                cucxC.load_custom_unit(reference_file)
 
         # return
         return cucxC
@@ -110,9 +134,109 @@ def go(reference_file=None) -> CustomUnitConverterX:
         raise Exception("Initializing failed!, ", e)
 
 
-def create_cuc(value: float, unit: str) -> CustomUnitConverter:
+def freeze(cucx: CustomUnitConverterX = None, gc_freeze=True) -> CustomUnitConverterX:
+    '''
+    Freezes the unit registry before forking worker processes
+
+    Parameters
+    ----------
+    cucx : CustomUnitConverterX, optional
+        converter with all units loaded (default: shared converter)
+    gc_freeze : bool
+        call `gc.freeze()` so workers share the registry pages
+
+    Returns
+    -------
+    cucx : CustomUnitConverterX
+        frozen converter
+
+    Notes
+    ------
+    1. Call it in the master process after `go(reference_file=...)` and before forking (gunicorn/uwsgi prefork).
+    2. Units cannot be added, loaded or reloaded afterwards.
+
+    Examples
+    --------
+    >>> cucx = pycuc.go(reference_file='custom-unit.yml')
+    >>> pycuc.freeze(cucx)
+    '''
+    try:
+        return _freeze(shared_converter() if cucx is None else cucx, gc_freeze=gc_freeze)
+    except Exception as e:
+        raise Exception('Freezing failed!, ', e)
+
+
+def register_family(name: str, scalar, vectorized=None, units=None, contains=None):
+    '''
+    Registers a conversion family with its own kernels
+
+    Parameters
+    ----------
+    name : str
+        family name used as reference such as 'API-GRAVITY'
+    scalar : callable
+        `scalar(value, from_unit, to_unit) -> float`
+    vectorized : callable, optional
+        `vectorized(values, from_unit, to_unit) -> numpy.ndarray`
+    units : iterable, optional
+        unit symbols of the family
+    contains : callable, optional
+        `contains(unit) -> bool` membership test
+
+    Returns
+    -------
+    UnitFamily
+        registered family
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> def db(value, from_unit, to_unit):
+    >>>     # power ratio <=> decibel
+    >>>     if from_unit == to_unit:
+    >>>         return value
+    >>>     return 10 * np.log10(value) if to_unit == 'dB' else 10 ** (value / 10)
+    >>> pycuc.register_family('DECIBEL', db, db, units=['dB', 'ratio'])
+    >>> print(pycuc.to(100, 'ratio => dB'))
+    '''
+    try:
+        return CustomUnitConverterX.register_family(name, scalar, vectorized=vectorized,
+                                                    units=units, contains=contains)
+    except Exception as e:
+        raise Exception('Registering family failed!, ', e)
+
+
+def search_units(query: str, limit: int = 20, fuzzy=True) -> list:
+    '''
+    Searches unit symbols (built-in, catalog, custom and family units)
+
+    Parameters
+    ----------
+    query : str
+        symbol or prefix such as 'kJ/'
+    limit : int
+        max number of results
+    fuzzy : bool
+        return similar symbols if no symbol starts with query such as 'kPaa' -> 'kPa'
+
+    Returns
+    -------
+    list
+        `(unit, [references])` tuples
+
+    Examples
+    --------
+    >>> print(pycuc.search_units('kJ/'))
+    '''
+    try:
+        return shared_converter().search_units(query, limit=limit, fuzzy=fuzzy)
+    except Exception as e:
+        raise Exception('Searching units failed!, ', e)
+
+
+def create_cuc(value: float, unit: str) -> Quantity:
     '''
-    Define a CustomUnitConverter object
+    Define a quantity (value with unit)
 
     Parameters
     ----------
@@ -123,8 +247,12 @@ def create_cuc(value: float, unit: str) -> CustomUnitConverter:
 
     Returns
     -------
-    CustomUnitConverter
-        A CustomUnitConverter object
+    Quantity
+        A lightweight quantity object sharing one converter
+
+    Notes
+    ------
+    1. Quantities support `convert`, `to`, `add_custom_unit`, `check_reference` and arithmetic (+, -, with scalars *, /, comparisons).
 
     Examples
     --------
@@ -157,7 +285,7 @@ def create_cuc(value: float, unit: str) -> CustomUnitConverter:
     >>> print(my_cuc_3.convert('kJ/mol.K'))
 
     '''
-    return CustomUnitConverter(value, unit)
+    return Quantity(value, unit)
 
 
 def convert_from_to(value: float, from_unit: str, to_unit: str, reference=None, reference_file=None) -> float:
@@ -197,11 +325,8 @@ def convert_from_to(value: float, from_unit: str, to_unit: str, reference=None,
     >>> print(pycuc.convert_from_to(25, 'C', 'K'))
     '''
     try:
-        # custom object
-        CustomUnitConverterC = CustomUnitConverter(value, from_unit)
-
-        # conversion
-        return CustomUnitConverterC.convert(to_unit, reference)
+        # conversion (shared converter)
+        return shared_converter().convert(value, str(from_unit).strip(), to_unit, reference)
 
     except Exception as e:
         raise Exception('Conversion failed, ', e)
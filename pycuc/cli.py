@@ -0,0 +1,176 @@
+# COMMAND LINE INTERFACE
+# =======================
+
+# import packages/modules
+import argparse
+import sys
+# local
+from .app import go
+from .config import __version__
+
+
+def _convert_file(args):
+    '''
+    Runs the `convert-file` command
+    '''
+    # init
+    cucxC = go(reference_file=args.reference_file)
+
+    # convert
+    n = cucxC.convert_file(args.src, args.dst, args.block, dtype=args.dtype,
+                           out_dtype=args.out_dtype, chunk_size=args.chunk_size,
+                           reference=args.reference)
+
+    print(f'{n} values converted ({args.block}): {args.dst}')
+    return 0
+
+
+def _convert_records(args):
+    '''
+    Runs the `convert-records` command
+    '''
+    import json
+
+    # schema
+    schema = {}
+    if args.schema:
+        with open(args.schema, 'r', encoding='utf-8') as f:
+            schema.update(json.load(f))
+    for field in args.field:
+        path, sep, block = field.partition('=')
+        if not sep:
+            raise ValueError(f"Invalid field '{field}', use 'path=from => to'")
+        schema[path.strip()] = block.strip()
+    if not schema:
+        raise ValueError('No fields, use --schema or --field')
+
+    # init
+    cucxC = go(reference_file=args.reference_file)
+    rc = cucxC.record_converter(schema, reference=args.reference,
+                                batch_size=args.batch_size)
+
+    # convert
+    n = rc.stream(args.src, args.dst)
+
+    if args.dst != '-':
+        print(f'{n} records converted: {args.dst}')
+    return 0
+
+
+def _serve(args):
+    '''
+    Runs the `serve` command
+    '''
+    from .docs.server import make_server
+
+    # init (preloaded)
+    cucxC = go(reference_file=args.reference_file)
+
+    # server
+    server = make_server(cucxC, reference_file=args.reference_file,
+                         host=args.host, port=args.port, unix_socket=args.unix_socket)
+
+    where = args.unix_socket or f'http://{args.host}:{args.port}'
+    print(f'pycuc serving on {where} (POST /convert, GET /stats)')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+def build_parser():
+    '''
+    Builds the argument parser
+
+    Returns
+    -------
+    argparse.ArgumentParser
+        parser
+    '''
+    parser = argparse.ArgumentParser(
+        prog='pycuc', description='PyCUC: custom unit conversion')
+    parser.add_argument('--version', action='version',
+                        version=f'pycuc {__version__}')
+    subparsers = parser.add_subparsers(dest='command')
+
+    # convert-file
+    p = subparsers.add_parser(
+        'convert-file', help='convert a .npy/.bin file through memory maps')
+    p.add_argument('src', help='source file (.npy or raw binary)')
+    p.add_argument('dst', help='destination file, same as src for in-place')
+    p.add_argument('block', help="unit conversion block such as 'psi => kPa'")
+    p.add_argument('--dtype', default='<f8',
+                   help='dtype of raw binary source files (default: <f8)')
+    p.add_argument('--out-dtype', default=None,
+                   help='destination dtype (default: source dtype)')
+    p.add_argument('--chunk-size', type=int, default=None,
+                   help='chunk size in bytes (default: 16 MiB)')
+    p.add_argument('--reference', default=None,
+                   help='reference name such as PRESSURE, TEMPERATURE, CUSTOM')
+    p.add_argument('--reference-file', default=None,
+                   help='yml reference file')
+    p.set_defaults(func=_convert_file)
+
+    # convert-records
+    p = subparsers.add_parser(
+        'convert-records', help='convert fields of NDJSON records')
+    p.add_argument('src', help="NDJSON source file, '-' for stdin")
+    p.add_argument('dst', help="NDJSON destination file, '-' for stdout")
+    p.add_argument('--schema', default=None,
+                   help="JSON file of path -> block such as {\"sensor.p\": \"psi => kPa\"}")
+    p.add_argument('--field', action='append', default=[],
+                   help="field conversion such as 'sensor.p=psi => kPa' (repeatable)")
+    p.add_argument('--batch-size', type=int, default=1024,
+                   help='records per batch (default: 1024)')
+    p.add_argument('--reference', default=None,
+                   help='reference name such as PRESSURE, TEMPERATURE, CUSTOM')
+    p.add_argument('--reference-file', default=None,
+                   help='yml reference file')
+    p.set_defaults(func=_convert_records)
+
+    # serve
+    p = subparsers.add_parser(
+        'serve', help='run a local batch conversion server')
+    p.add_argument('--reference-file', default=None,
+                   help='yml reference file (hot-reloaded on change)')
+    p.add_argument('--host', default='127.0.0.1',
+                   help='host (default: 127.0.0.1)')
+    p.add_argument('--port', type=int, default=8765,
+                   help='port (default: 8765)')
+    p.add_argument('--unix-socket', default=None,
+                   help='serve on a unix socket instead of host/port')
+    p.set_defaults(func=_serve)
+
+    return parser
+
+
+def main(argv=None):
+    '''
+    Command line entry point
+
+    Parameters
+    ----------
+    argv : list, optional
+        arguments (default: sys.argv[1:])
+
+    Returns
+    -------
+    int
+        exit code
+    '''
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    # check
+    if args.command is None:
+        parser.print_help()
+        return 1
+
+    try:
+        return args.func(args)
+    except Exception as e:
+        print(f'pycuc: {e}', file=sys.stderr)
+        return 1
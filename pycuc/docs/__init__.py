@@ -1,5 +1,7 @@
 from .cuc import CustomUnitConverter
 from .cucx import CustomUnitConverterX
 from .utils import Utils
+from .quantity import Quantity
+from .unitarray import UnitArray
 
-__all__ = ['CustomUnitConverter', 'Utils', 'CustomUnitConverterX']
+__all__ = ['CustomUnitConverter', 'Utils', 'CustomUnitConverterX', 'Quantity', 'UnitArray']
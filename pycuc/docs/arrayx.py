@@ -0,0 +1,234 @@
+# ARRAY CONVERSION
+# =================
+
+# import packages/modules
+import numpy as np
+
+
+def is_array(value):
+    '''
+    Checks if the value is a numpy array
+
+    Parameters
+    ----------
+    value : any
+        value
+
+    Returns
+    -------
+    bool
+        True if value is a numpy array
+    '''
+    return isinstance(value, np.ndarray)
+
+
+def convert_array(values, scale, offset=0.0, out=None, dtype=None):
+    '''
+    Applies `values * scale + offset` with numpy ufuncs
+
+    Parameters
+    ----------
+    values : numpy.ndarray
+        values
+    scale : float
+        scale factor
+    offset : float
+        offset
+    out : numpy.ndarray, optional
+        output array, `out=values` converts in place
+    dtype : str | numpy.dtype, optional
+        output dtype such as float32, float64 (default: dtype of values for floats, float64 otherwise)
+
+    Returns
+    -------
+    numpy.ndarray
+        converted values (`out` if provided)
+
+    Notes
+    ------
+    1. Only one output buffer is allocated (none when `out` is provided).
+    2. A read-only `out` (such as a read-only `out=values`) raises instead of being copied.
+    '''
+    try:
+        # set
+        values = np.asarray(values)
+
+        # output
+        out = prepare_out(values, out, dtype)
+
+        # convert (python floats keep the output precision)
+        np.multiply(values, scale, out=out, casting='same_kind')
+
+        # offset
+        if offset != 0:
+            np.add(out, offset, out=out)
+
+        return out
+    except Exception as e:
+        raise Exception('Array conversion failed!, ', e)
+
+
+# bounds policies
+BOUNDS_POLICIES = ('mask', 'clip', 'nan', 'raise')
+# elements per block of bounded conversions (fits in cache)
+BOUNDS_BLOCK = 1 << 16
+
+
+def convert_array_bounded(values, scale, offset, lower, upper, policy='mask', out=None, dtype=None,
+                          kernel=None):
+    '''
+    Applies `values * scale + offset` and checks bounds in the same pass
+
+    Parameters
+    ----------
+    values : numpy.ndarray
+        values
+    scale : float
+        scale factor
+    offset : float
+        offset
+    lower : float | None
+        lower bound in the output unit
+    upper : float | None
+        upper bound in the output unit
+    policy : str
+        'mask' (also return the validity mask), 'clip', 'nan' or 'raise'
+    out : numpy.ndarray, optional
+        output array, `out=values` converts in place
+    dtype : str | numpy.dtype, optional
+        output dtype
+    kernel : callable, optional
+        `kernel(values, out)` converting a block (plugin families), replaces scale and offset
+
+    Returns
+    -------
+    numpy.ndarray | tuple
+        converted values, `(values, valid)` for 'mask'
+
+    Notes
+    ------
+    1. Values are converted and checked block by block, so each block is checked while still in cache.
+    2. NaN values are invalid ('mask', 'raise') and stay NaN ('clip').
+    3. 'raise' never changes the input: in-place conversions are checked in a first pass before anything is written, a separate `out` may hold partial results.
+    '''
+    try:
+        # check
+        if policy not in BOUNDS_POLICIES:
+            raise ValueError(
+                f"Bounds policy must be one of {', '.join(BOUNDS_POLICIES)}")
+
+        # set
+        values = np.asarray(values)
+        out = prepare_out(values, out, dtype)
+        valid = np.empty(values.shape, dtype=bool) if policy in (
+            'mask', 'raise') else None
+
+        # flat views (the output cannot be a copy)
+        src = values.reshape(-1)
+        dst = out.reshape(-1)
+        if dst.size and not np.shares_memory(dst, out):
+            raise ValueError('Output array must be contiguous')
+        flags = valid.reshape(-1) if valid is not None else None
+
+        def convert(block, res):
+            if kernel is not None:
+                kernel(src[block], res)
+            else:
+                np.multiply(src[block], scale, out=res, casting='same_kind')
+                if offset != 0:
+                    np.add(res, offset, out=res)
+
+        def check(res):
+            ok = ~np.isnan(res)
+            if lower is not None:
+                ok &= res >= lower
+            if upper is not None:
+                ok &= res <= upper
+            return ok
+
+        # raise in place: check every block before the input is overwritten
+        if policy == 'raise' and dst.size and np.shares_memory(dst, src):
+            scratch = np.empty(min(BOUNDS_BLOCK, src.size), dtype=out.dtype)
+            invalid = 0
+            for start in range(0, src.size, BOUNDS_BLOCK):
+                block = slice(start, start + BOUNDS_BLOCK)
+                res = scratch[:src[block].size]
+                convert(block, res)
+                invalid += int(res.size - np.count_nonzero(check(res)))
+            if invalid:
+                raise ValueError(
+                    f'{invalid} values out of bounds [{lower}, {upper}]')
+            # all valid, nothing left to check
+            flags = None
+
+        for start in range(0, src.size, BOUNDS_BLOCK):
+            block = slice(start, start + BOUNDS_BLOCK)
+            res = dst[block]
+
+            # convert
+            convert(block, res)
+
+            # bounds
+            if policy == 'clip':
+                if lower is not None or upper is not None:
+                    np.clip(res, lower, upper, out=res)
+            elif policy == 'nan':
+                res[~check(res)] = np.nan
+            elif flags is not None:
+                flags[block] = check(res)
+
+        # raise
+        if policy == 'raise' and flags is not None and not valid.all():
+            raise ValueError(
+                f'{int((~valid).sum())} values out of bounds [{lower}, {upper}]')
+
+        return (out, valid) if policy == 'mask' else out
+    except Exception as e:
+        raise Exception('Bounded array conversion failed!, ', e)
+
+
+def prepare_out(values, out=None, dtype=None):
+    '''
+    Checks or allocates the output array of a conversion
+
+    Parameters
+    ----------
+    values : numpy.ndarray
+        values
+    out : numpy.ndarray, optional
+        output array
+    dtype : str | numpy.dtype, optional
+        output dtype
+
+    Returns
+    -------
+    numpy.ndarray
+        output array
+    '''
+    # allocate
+    if out is None:
+        # dtype
+        if dtype is None:
+            dtype = values.dtype if np.issubdtype(
+                values.dtype, np.floating) else np.float64
+        return np.empty(values.shape, dtype=dtype)
+
+    # check
+    if not isinstance(out, np.ndarray):
+        raise TypeError('out must be a numpy array')
+    if not out.flags.writeable:
+        if out is values:
+            raise ValueError(
+                'Input array is read-only, in-place conversion is not possible')
+        raise ValueError('Output array is read-only')
+    if out.shape != values.shape:
+        raise ValueError(
+            f'Output shape {out.shape} does not match input shape {values.shape}')
+    if dtype is not None and np.dtype(dtype) != out.dtype:
+        raise ValueError(
+            f'Output dtype {out.dtype} does not match dtype {np.dtype(dtype)}')
+    if not np.issubdtype(out.dtype, np.floating):
+        raise TypeError(
+            f'Output dtype must be floating, got {out.dtype}')
+
+    return out
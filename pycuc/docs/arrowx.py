@@ -0,0 +1,145 @@
+# ARROW CONVERSION
+# =================
+
+# import packages/modules
+# optional: pyarrow (imported on first use to keep `import pycuc` fast)
+pa = None
+pc = None
+
+
+def load_pyarrow():
+    '''
+    Imports pyarrow on first use
+
+    Returns
+    -------
+    bool
+        True if pyarrow is available
+    '''
+    global pa, pc
+    if pa is None:
+        try:
+            import pyarrow
+            import pyarrow.compute
+        except ImportError:  # pragma: no cover
+            return False
+        pa, pc = pyarrow, pyarrow.compute
+    return True
+
+
+def is_arrow(value):
+    '''
+    Checks if the value is a pyarrow array or chunked array
+
+    Parameters
+    ----------
+    value : any
+        value
+
+    Returns
+    -------
+    bool
+        True if value is an arrow array
+    '''
+    # check (pyarrow objects can only exist if pyarrow is importable)
+    if not type(value).__module__.startswith('pyarrow'):
+        return False
+    load_pyarrow()
+    return isinstance(value, (pa.Array, pa.ChunkedArray))
+
+
+def is_arrow_series(value):
+    '''
+    Checks if the value is a pandas series backed by an `ArrowDtype`
+
+    Parameters
+    ----------
+    value : any
+        value
+
+    Returns
+    -------
+    bool
+        True if value is an arrow-backed pandas series
+    '''
+    # keep the check cheap for non-series
+    dtype = getattr(value, 'dtype', None)
+    if dtype is None or not hasattr(value, 'index'):
+        return False
+
+    import pandas as pd
+    if not isinstance(dtype, pd.ArrowDtype):
+        return False
+    return load_pyarrow()
+
+
+def convert_arrow(values, scale, offset=0.0):
+    '''
+    Applies `values * scale + offset` with arrow compute kernels
+
+    Parameters
+    ----------
+    values : pyarrow.Array | pyarrow.ChunkedArray
+        values
+    scale : float
+        scale factor
+    offset : float
+        offset
+
+    Returns
+    -------
+    pyarrow.Array | pyarrow.ChunkedArray
+        converted values, nulls are preserved
+
+    Notes
+    ------
+    1. float32/float64 arrays keep their type, float16 is cast to float32 and other numeric types to float64.
+    '''
+    try:
+        # check type (arrow has no float16 compute kernels)
+        if not pa.types.is_floating(values.type):
+            values = pc.cast(values, pa.float64())
+        elif pa.types.is_float16(values.type):
+            values = pc.cast(values, pa.float32())
+
+        # scalar with the same type (no upcast of float32)
+        res = pc.multiply(values, pa.scalar(scale, type=values.type))
+
+        # offset
+        if offset != 0:
+            res = pc.add(res, pa.scalar(offset, type=values.type))
+
+        return res
+    except Exception as e:
+        raise Exception('Arrow conversion failed!, ', e)
+
+
+def convert_arrow_series(series, scale, offset=0.0):
+    '''
+    Converts an arrow-backed pandas series
+
+    Parameters
+    ----------
+    series : pandas.Series
+        series with `ArrowDtype`
+    scale : float
+        scale factor
+    offset : float
+        offset
+
+    Returns
+    -------
+    pandas.Series
+        converted series with `ArrowDtype`, index and name are kept
+    '''
+    try:
+        import pandas as pd
+
+        # arrow data (no copy)
+        res = convert_arrow(series.array.__arrow_array__(), scale, offset)
+
+        # wrap
+        return pd.Series(pd.arrays.ArrowExtensionArray(res),
+                         index=series.index, name=series.name, copy=False)
+    except Exception as e:
+        raise Exception('Arrow series conversion failed!, ', e)
@@ -0,0 +1,115 @@
+# BUILT-IN UNIT CATALOG
+# ======================
+
+# import packages/modules
+# local
+from .frozen import FrozenGroup
+
+# symbols (space separated) and factors per family
+# factor = amount of the unit in one base unit (first symbol), as in `Refs`
+_SYMBOLS = {
+    'ENERGY': 'J kJ MJ GJ Wh kWh MWh cal kcal Btu MMBtu therm eV erg',
+    'MASS': 'kg g mg ug t lb oz gr ton_us ton_uk',
+    'LENGTH': 'm km cm mm um nm in ft yd mi nmi',
+    'VOLUME': 'm3 dm3 cm3 L mL ft3 in3 gal gal_imp bbl',
+    'FLOW': 'm3/s m3/min m3/h m3/d L/s L/min L/h ft3/s ft3/min ft3/h gal/min bbl/d',
+    'POWER': 'W kW MW GW hp J/s kJ/s kJ/h Btu/h kcal/h',
+    'VISCOSITY': 'Pa.s mPa.s P cP lb/ft.s',
+    'DENSITY': 'kg/m3 g/cm3 g/mL g/L kg/L lb/ft3 lb/in3 lb/gal',
+    'HEAT-CAPACITY': 'J/kg.K kJ/kg.K J/g.K cal/g.K kcal/kg.K Btu/lb.F',
+    'MOLAR-HEAT-CAPACITY': 'J/mol.K kJ/mol.K J/kmol.K kJ/kmol.K cal/mol.K kcal/kmol.K',
+}
+
+_FACTORS = {
+    'ENERGY': (1.0, 1e-3, 1e-6, 1e-9, 1 / 3600, 1 / 3.6e6, 1 / 3.6e9, 1 / 4.184, 1 / 4184,
+               1 / 1055.05585262, 1 / 1055055852.62, 1 / 105505585.262, 1 / 1.602176634e-19, 1e7),
+    'MASS': (1.0, 1e3, 1e6, 1e9, 1e-3, 1 / 0.45359237, 1 / 0.028349523125, 1 / 6.479891e-5,
+             1 / 907.18474, 1 / 1016.0469088),
+    'LENGTH': (1.0, 1e-3, 1e2, 1e3, 1e6, 1e9, 1 / 0.0254, 1 / 0.3048, 1 / 0.9144, 1 / 1609.344,
+               1 / 1852),
+    'VOLUME': (1.0, 1e3, 1e6, 1e3, 1e6, 1 / 0.028316846592, 1 / 1.6387064e-5, 1 / 3.785411784e-3,
+               1 / 4.54609e-3, 1 / 0.158987294928),
+    'FLOW': (1.0, 60.0, 3600.0, 86400.0, 1e3, 6e4, 3.6e6, 1 / 0.028316846592, 60 / 0.028316846592,
+             3600 / 0.028316846592, 60 / 3.785411784e-3, 86400 / 0.158987294928),
+    'POWER': (1.0, 1e-3, 1e-6, 1e-9, 1 / 745.69987158227022, 1.0, 1e-3, 3.6, 3600 / 1055.05585262,
+              3600 / 4184),
+    'VISCOSITY': (1.0, 1e3, 10.0, 1e3, 1 / 1.488163943570828),
+    'DENSITY': (1.0, 1e-3, 1e-3, 1.0, 1e-3, 1 / 16.018463373960138, 1 / 27679.904710203125,
+                1 / 119.82642731689663),
+    'HEAT-CAPACITY': (1.0, 1e-3, 1e-3, 1 / 4184, 1 / 4184, 1 / 4186.8),
+    'MOLAR-HEAT-CAPACITY': (1.0, 1e-3, 1e3, 1.0, 1 / 4.184, 1 / 4.184),
+}
+
+
+class UnitCatalog:
+    '''
+    Built-in unit families materialized on first access
+
+    Only the symbol index is built on the first lookup, the factors of a
+    family are materialized (as a `FrozenGroup`) when it is first used.
+    '''
+
+    def __init__(self, symbols, factors):
+        self._symbols = symbols
+        self._factors = factors
+        # materialized families
+        self._groups = {}
+        # symbol -> family (built on first lookup)
+        self._index = None
+
+    def __contains__(self, family):
+        return family in self._symbols
+
+    def __iter__(self):
+        return iter(self._symbols)
+
+    def families(self):
+        '''
+        Returns the family names
+        '''
+        return list(self._symbols)
+
+    def symbols(self, family):
+        '''
+        Returns the unit symbols of a family (without materializing factors)
+        '''
+        return self._symbols[family].split()
+
+    def _build_index(self):
+        index = {}
+        for family, symbols in self._symbols.items():
+            for symbol in symbols.split():
+                index.setdefault(symbol, family)
+        self._index = index
+        return index
+
+    def family_of(self, unit):
+        '''
+        Returns the family of a unit or None
+        '''
+        index = self._index if self._index is not None else self._build_index()
+        return index.get(unit)
+
+    def find(self, from_unit, to_unit):
+        '''
+        Returns the family of both units or None
+        '''
+        family = self.family_of(from_unit)
+        if family is not None and self.family_of(to_unit) == family:
+            return family
+        return None
+
+    def group(self, family):
+        '''
+        Returns a family as a read-only unit -> factor mapping (materialized once)
+        '''
+        group = self._groups.get(family)
+        if group is None:
+            symbols = self._symbols[family].split()
+            group = FrozenGroup(dict(zip(symbols, self._factors[family])))
+            self._groups[family] = group
+        return group
+
+
+# shared catalog
+CATALOG = UnitCatalog(_SYMBOLS, _FACTORS)
@@ -2,10 +2,10 @@
 # ======================
 
 # import packages/modules
-import pandas as pd
 # local
 from .utils import Utils
 from .refs import Refs
+from .views import ReferenceViews
 
 
 class CustomUnitConverter(Utils, Refs):
@@ -23,6 +23,10 @@ class CustomUnitConverter(Utils, Refs):
         'CUSTOM': _custom_conversions
     }
 
+    # registry version (bumped when units change) and reference views
+    _registry_version = 0
+    _reference_views = ReferenceViews()
+
     def __init__(self, value, unit, reference_file=''):
         self.value = value
         self.unit = str(unit).strip()
@@ -46,58 +50,57 @@ class CustomUnitConverter(Utils, Refs):
 
         Returns
         -------
-        reference : dict | dataframe
-            reference details
+        reference : MappingProxyType | dataframe
+            reference details (read-only, cached until the units change)
         '''
         try:
             # set
             reference = str(reference).strip().upper()
 
-            # sub reference
-            sub_reference = None
-            if '::' in reference:
-                # split
-                reference_split = reference.split('::')
-                # set
-                reference = reference_split[1]
-                sub_reference = reference
-
-            # refs
-            refs = {
-                'PRESSURE': self._pressure_conversions,
-                'TEMPERATURE': self._temperature_conversions,
-                'CUSTOM': self._custom_conversions_full
-            }
-
-            # take all keys
-            custom_keys = list(self._custom_conversions_full.keys())
-            # all keys
-            all_keys = list(set(list(refs.keys()) + custom_keys))
-
-            # check
-            if reference not in all_keys:
-                raise Exception('Reference not found')
-
-            # if contain ::
-            if sub_reference:
-                # set
-                res = self._custom_conversions_full[sub_reference]
-            elif reference == 'CUSTOM':
-                res = self._custom_conversions_full['CUSTOM']
-            else:
-                # dict
-                res = refs[reference]
-
-            if dataframe:
-                # Convert dictionary to DataFrame
-                df = pd.DataFrame(list(res.items()),
-                                  columns=['Unit', 'Value'])
-                return df
-            else:
-                return res
+            return self._reference_views.get((reference, bool(dataframe)), self._registry_version,
+                                             lambda: self._reference_units(reference))
         except Exception as e:
             raise Exception('Checking references failed!, ', e)
 
+    def _reference_units(self, reference):
+        '''
+        Selects the units of a reference
+        '''
+        # sub reference
+        sub_reference = None
+        if '::' in reference:
+            # split
+            reference_split = reference.split('::')
+            # set
+            reference = reference_split[1]
+            sub_reference = reference
+
+        # refs
+        refs = {
+            'PRESSURE': self._pressure_conversions,
+            'TEMPERATURE': self._temperature_conversions,
+            'CUSTOM': self._custom_conversions_full
+        }
+
+        # take all keys
+        custom_keys = list(self._custom_conversions_full.keys())
+        # all keys
+        all_keys = list(set(list(refs.keys()) + custom_keys))
+
+        # check
+        if reference not in all_keys:
+            raise Exception('Reference not found')
+
+        # if contain ::
+        if sub_reference:
+            # set
+            return self._custom_conversions_full[sub_reference]
+        elif reference == 'CUSTOM':
+            return self._custom_conversions_full['CUSTOM']
+        else:
+            # dict
+            return refs[reference]
+
     def find_reference(self, from_unit, to_unit):
         '''
         Finds the conversion function
@@ -289,6 +292,7 @@ class CustomUnitConverter(Utils, Refs):
         try:
             # add
             self._custom_conversions[unit] = conversion_factor
+            CustomUnitConverter._registry_version += 1
             return True
         except Exception as e:
             raise Exception('Adding new unit failed!, ', e)
@@ -322,6 +326,7 @@ class CustomUnitConverter(Utils, Refs):
             # update custom conversion
             for key, value in custom_unit['CUSTOM-UNIT'].items():
                 self._custom_conversions_full[str(key).strip()] = value
+            CustomUnitConverter._registry_version += 1
 
             return self._custom_conversions_full
 
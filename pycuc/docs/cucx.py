@@ -2,10 +2,28 @@
 # ======================
 
 # import packages/modules
-import pandas as pd
+import os
+import time
+import numpy as np
 # local
 from .utils import Utils
 from .refs import Refs
+from .arrowx import is_arrow, is_arrow_series, convert_arrow, convert_arrow_series
+from .arrayx import is_array, convert_array, convert_array_bounded
+from .filex import convert_file as _convert_file
+from .ufuncx import UnitUfunc
+from .watch import diff_reference, ReferenceWatcher, timed
+from .layers import load_layers, INCLUDE_KEY
+from .loaders import BOUNDS_KEY, parse_bounds
+from .family import UnitFamily
+from .frozen import check_not_frozen
+from .catalog import CATALOG
+from .search import UnitSearchIndex
+from .views import ReferenceViews
+from .streamx import RecordConverter, parse_path
+from .headers import parse_header, HeaderPlan
+from .factors import FactorValidationError, check_factor, validate_groups
+from .picklex import registry_state, fingerprint, publish_registry, load_registry
 
 
 class CustomUnitConverterX(Utils, Refs):
@@ -22,6 +40,46 @@ class CustomUnitConverterX(Utils, Refs):
         'CUSTOM': _custom_conversions
     }
 
+    # resolved conversion factors (from_unit, to_unit, reference) -> (scale, offset)
+    _conversion_factors_cache = {}
+    # compiled conversion blocks (block, reference) -> (from_unit, to_unit, scale, offset)
+    _block_cache = {}
+    # owner layer (absolute path) of each loaded group
+    _loaded_groups = {}
+    # loaded reference files (absolute paths) -> layers, includes first
+    _layer_stacks = {}
+
+    # frozen registry (pycuc.freeze)
+    _frozen = False
+
+    # plugin conversion families
+    _families = {}
+    # unit -> family names (families with a unit list)
+    _unit_index = {}
+    # families with a membership test only
+    _predicate_families = []
+    # resolved families (from_unit, to_unit, reference) -> family | None
+    _family_cache = {}
+
+    # unit search index (built on first search)
+    _search_index = None
+
+    # registry version (bumped when units change) and reference views
+    _registry_version = 0
+    _reference_views = ReferenceViews()
+
+    # registry fingerprint (version, fingerprint, serialized state)
+    _fingerprint = None
+
+    # bounds of custom groups and overrides: reference -> (unit, lower, upper)
+    _bounds = {}
+    # resolved bounds (from_unit, to_unit, reference) -> (lower, upper) | None
+    _bounds_cache = {}
+    # compiled record schemas (schema items, reference) -> fields
+    _record_cache = {}
+    # header plans (headers, targets, reference) -> HeaderPlan
+    _plan_cache = {}
+
     def __init__(self, value, unit, reference_file=None):
         self.value = value
         self.unit = str(unit).strip()
@@ -34,6 +92,72 @@ class CustomUnitConverterX(Utils, Refs):
         self._pressure_conversions = self.pressure_conversions_ref
         self._temperature_conversions = self.temperature_conversions_ref
 
+    def __reduce__(self):
+        '''
+        Pickles the converter with its registry fingerprint
+
+        Notes
+        ------
+        1. A pickle holds the registry fingerprint only. The registry (custom groups and bounds) is written once as json to `pycuc-registry-<fingerprint>.json` in the registry folder (`PYCUC_REGISTRY_DIR` or the temporary folder), which must be shared with the receiving processes.
+        2. Worker processes read each registry once (cached by fingerprint, checked against its content) and install it if it differs from their own.
+        3. Plugin families hold python callables and must be registered in the workers (such as on import).
+        '''
+        try:
+            cls = type(self)
+            key = cls.registry_fingerprint()
+            version, _, data = cls._fingerprint
+            if data is None:
+                # installed from another process (serialized once)
+                _, data = fingerprint(registry_state(cls))
+                cls._fingerprint = (version, key, data)
+            publish_registry(key, data)
+            return (_restore_converter, (key, self.value, self.unit, self.reference_file))
+        except Exception as e:
+            raise Exception('Pickling converter failed!, ', e)
+
+    @classmethod
+    def registry_fingerprint(cls):
+        '''
+        Returns the fingerprint of the custom units and bounds (cached per registry version)
+
+        Returns
+        -------
+        str
+            fingerprint (hex)
+        '''
+        # cached
+        cached = cls._fingerprint
+        if cached is not None and cached[0] == cls._registry_version:
+            return cached[1]
+
+        # compute
+        key, data = fingerprint(registry_state(cls))
+        cls._fingerprint = (cls._registry_version, key, data)
+
+        return key
+
+    @classmethod
+    def _install_registry(cls, key, state):
+        '''
+        Replaces the custom units and bounds with a registry received from another process
+        '''
+        # check
+        check_not_frozen(cls)
+
+        # copy (the cached state stays intact)
+        groups = {group: dict(units) for group, units in state['groups'].items()}
+        groups.setdefault('CUSTOM', {})
+
+        # set
+        cls._custom_conversions_full = groups
+        cls._custom_conversions = groups['CUSTOM']
+        cls._bounds = dict(state['bounds'])
+        cls._loaded_groups = {}
+        cls._layer_stacks = {}
+        cls._search_index = None
+        cls._reset_caches()
+        cls._fingerprint = (cls._registry_version, key, None)
+
     def check_reference(self, reference, dataframe=True):
         '''
         Checks if the reference is valid
@@ -45,56 +169,65 @@ class CustomUnitConverterX(Utils, Refs):
 
         Returns
         -------
-        reference : dict | dataframe
-            reference details
+        reference : MappingProxyType | dataframe
+            reference details (read-only)
+
+        Notes
+        ------
+        1. Views are cached until the units change (registry version), dataframes share read-only data.
         '''
         try:
             # set
             reference = str(reference).strip().upper()
 
-            # sub reference
-            sub_reference = None
-            if '::' in reference:
-                # split
-                reference_split = reference.split('::')
-                # set
-                reference = reference_split[1]
-                sub_reference = reference
-
-            # refs
-            refs = {
-                'PRESSURE': self._pressure_conversions,
-                'TEMPERATURE': self._temperature_conversions,
-                'CUSTOM': self._custom_conversions_full
-            }
-
-            # take all keys
-            custom_keys = list(self._custom_conversions_full.keys())
-            # all keys
-            all_keys = list(set(list(refs.keys()) + custom_keys))
-
-            # check
-            if reference not in all_keys:
-                raise Exception('Reference not found')
-
-            # if contain ::
-            if sub_reference:
-                # set
-                res = self._custom_conversions_full[sub_reference]
-            else:
-                # dict
-                res = refs[reference]
-
-            if dataframe:
-                # Convert dictionary to DataFrame
-                df = pd.DataFrame(list(res.items()),
-                                  columns=['Unit', 'Value'])
-                return df
-            else:
-                return res
+            return self._reference_views.get((reference, bool(dataframe)), self._registry_version,
+                                             lambda: self._reference_units(reference))
         except Exception as e:
             raise Exception(f'Checking {reference} failed!, ', e)
 
+    def _reference_units(self, reference):
+        '''
+        Selects the units of a reference
+        '''
+        # sub reference
+        sub_reference = None
+        if '::' in reference:
+            # split
+            reference_split = reference.split('::')
+            # set
+            reference = reference_split[1]
+            sub_reference = reference
+
+        # refs
+        refs = {
+            'PRESSURE': self._pressure_conversions,
+            'TEMPERATURE': self._temperature_conversions,
+            'CUSTOM': self._custom_conversions_full
+        }
+
+        # take all keys
+        custom_keys = list(self._custom_conversions_full.keys())
+        # all keys (built-in catalog families included)
+        all_keys = list(set(list(refs.keys()) + custom_keys +
+                        CATALOG.families()))
+
+        # check
+        if reference not in all_keys:
+            raise Exception('Reference not found')
+
+        # if contain ::
+        if sub_reference and sub_reference in self._custom_conversions_full:
+            # set
+            return self._custom_conversions_full[sub_reference]
+        elif reference in refs:
+            # dict
+            return refs[reference]
+        elif reference in CATALOG:
+            # built-in catalog
+            return CATALOG.group(reference)
+        else:
+            return self._custom_conversions_full[reference]
+
     def find_reference(self, from_unit, to_unit):
         '''
         Finds the conversion function
@@ -129,14 +262,212 @@ class CustomUnitConverterX(Utils, Refs):
                     if from_unit in value and to_unit in value:
                         reference = 'CUSTOM'
 
+            # built-in catalog
+            if reference is None:
+                reference = CATALOG.find(from_unit, to_unit)
+
+            # plugin families
+            if reference is None and self._families:
+                reference = self._find_family(from_unit, to_unit)
+
             # check
             if reference is None:
-                raise Exception('Conversion units not found')
+                raise Exception(self._not_found_message(from_unit, to_unit))
 
             return reference
         except Exception as e:
             raise Exception('Finding reference failed!, ', e)
 
+    def _not_found_message(self, from_unit, to_unit):
+        '''
+        Builds the error message of unknown units with suggestions
+        '''
+        # index
+        index = self.search_index()
+
+        # unknown units
+        hints = []
+        for unit in (from_unit, to_unit):
+            if unit not in index:
+                suggestions = index.similar(unit, 3)
+                hint = f"unknown unit '{unit}'"
+                if suggestions:
+                    hint += f" (did you mean: {', '.join(suggestions)}?)"
+                hints.append(hint)
+
+        # known units of different references
+        if not hints:
+            hints.append(f"'{from_unit}' ({', '.join(index.references(from_unit))}) and "
+                         f"'{to_unit}' ({', '.join(index.references(to_unit))}) have no common reference")
+
+        return 'Conversion units not found: ' + '; '.join(hints)
+
+    def _find_family(self, from_unit, to_unit):
+        '''
+        Finds the plugin family of both units through the unit index
+
+        Returns
+        -------
+        str | None
+            family name
+        '''
+        # indexed families
+        for name in self._unit_index.get(from_unit, ()):
+            if self._families[name].contains(to_unit):
+                return name
+
+        # membership tests
+        for name in self._predicate_families:
+            family = self._families[name]
+            if family.contains(from_unit) and family.contains(to_unit):
+                return name
+
+        return None
+
+    def _plugin_family(self, from_unit, to_unit, reference=None):
+        '''
+        Returns the plugin family of a conversion or None for built-in references
+        '''
+        # cache (kept for the save, reloads swap in a new one)
+        cache = self._family_cache
+        key = (from_unit, to_unit, reference)
+        if key in cache:
+            return cache[key]
+
+        # reference
+        if reference is None:
+            reference = self.find_reference(from_unit, to_unit)
+        family = self._families.get(str(reference).strip().upper())
+
+        # save
+        cache[key] = family
+
+        return family
+
+    def _block_family(self, unit_conversion_block, reference=None):
+        '''
+        Returns `(from_unit, to_unit, family)` of a block in a plugin family or None
+        '''
+        # check
+        if not self._families:
+            return None
+
+        # interpret the unit conversion block
+        from_unit, _, to_unit = self.check_conversion_block(
+            unit_conversion_block)
+        family = self._plugin_family(from_unit, to_unit, reference)
+
+        return None if family is None else (from_unit, to_unit, family)
+
+    @classmethod
+    def register_family(cls, name, scalar, vectorized=None, units=None, contains=None):
+        '''
+        Registers a conversion family with its own kernels
+
+        Parameters
+        ----------
+        name : str
+            family name used as reference such as 'API-GRAVITY'
+        scalar : callable
+            `scalar(value, from_unit, to_unit) -> float`
+        vectorized : callable, optional
+            `vectorized(values, from_unit, to_unit) -> numpy.ndarray`
+        units : iterable, optional
+            unit symbols of the family (indexed for O(1) lookup)
+        contains : callable, optional
+            `contains(unit) -> bool` membership test
+
+        Returns
+        -------
+        UnitFamily
+            registered family
+
+        Notes
+        ------
+        1. Built-in references (PRESSURE, TEMPERATURE, CUSTOM) are resolved first.
+        2. Families with a unit list are found through a unit -> family index.
+
+        Examples
+        --------
+        >>> def api_sg(value, from_unit, to_unit):
+        >>>     if from_unit == to_unit:
+        >>>         return value
+        >>>     return 141.5 / (value + 131.5) if from_unit == 'API' else 141.5 / value - 131.5
+        >>> CustomUnitConverterX.register_family('API-GRAVITY', api_sg, api_sg, units=['API', 'SG'])
+        >>> cucx.to(35, 'API => SG')
+        '''
+        try:
+            # check
+            check_not_frozen(cls)
+
+            # family
+            family = UnitFamily(name, scalar, vectorized=vectorized,
+                                units=units, contains=contains)
+
+            # check
+            if family.name in ('PRESSURE', 'TEMPERATURE', 'CUSTOM'):
+                raise ValueError(f'{family.name} is a built-in reference')
+
+            # replace
+            if family.name in cls._families:
+                cls.unregister_family(family.name)
+
+            # register
+            cls._families[family.name] = family
+            cls._index_units(family.name, new=family.units or ())
+            if family.units is not None:
+                for unit in family.units:
+                    cls._unit_index.setdefault(unit, []).append(family.name)
+            if family._contains is not None:
+                cls._predicate_families.append(family.name)
+
+            # reset resolved references
+            cls._reset_caches()
+
+            return family
+        except Exception as e:
+            raise Exception('Registering family failed!, ', e)
+
+    @classmethod
+    def unregister_family(cls, name):
+        '''
+        Removes a conversion family
+
+        Parameters
+        ----------
+        name : str
+            family name
+
+        Returns
+        -------
+        bool
+            True if removed
+        '''
+        # check
+        check_not_frozen(cls)
+
+        # set
+        name = str(name).strip().upper()
+        family = cls._families.pop(name, None)
+        if family is None:
+            return False
+        cls._index_units(name, old=family.units or ())
+
+        # index
+        for unit in family.units or ():
+            names = cls._unit_index.get(unit, [])
+            if name in names:
+                names.remove(name)
+            if not names:
+                cls._unit_index.pop(unit, None)
+        if name in cls._predicate_families:
+            cls._predicate_families.remove(name)
+
+        # reset resolved references
+        cls._reset_caches()
+
+        return True
+
     def check_conversion_block(self, conversion_block):
         '''
         Checks conversion block
@@ -156,18 +487,24 @@ class CustomUnitConverterX(Utils, Refs):
         except Exception as e:
             raise Exception("Checking conversion block failed!, ", e)
 
-    def to(self, value, unit_conversion_block, reference=None):
+    def to(self, value, unit_conversion_block, reference=None, out=None, dtype=None, bounds=None):
         '''
         Converts through a unit conversion block 
 
         Parameters
         ----------
-        value : float
+        value : float | numpy.ndarray
             value
         unit_conversion_block : str
             unit conversion block
         reference : str
             reference name such as pressure, temperature, custom
+        out : numpy.ndarray, optional
+            output array for array values, `out=value` converts in place
+        dtype : str | numpy.dtype, optional
+            output dtype for numpy arrays such as float32 (other inputs raise)
+        bounds : str, optional
+            bounds policy: 'mask', 'clip', 'nan' or 'raise' (see `convert`)
         '''
         try:
             # interpret the unit conversion block
@@ -175,36 +512,397 @@ class CustomUnitConverterX(Utils, Refs):
                 unit_conversion_block)
 
             # convert
-            return self.convert(value, from_unit, to_unit, reference)
+            return self.convert(value, from_unit, to_unit, reference, out=out, dtype=dtype,
+                                bounds=bounds)
         except Exception as e:
             raise Exception('Conversion failed!, ', e)
 
-    def from_to(self, value, from_unit, to_unit, reference=None):
+    def from_to(self, value, from_unit, to_unit, reference=None, out=None, dtype=None, bounds=None):
         '''
         Converts from one unit to another
 
         Parameters
         ----------
-        value : float
+        value : float | numpy.ndarray
             value
         from_unit : str
             from unit
         to_unit : str
             to unit
+        out : numpy.ndarray, optional
+            output array for array values, `out=value` converts in place
+        dtype : str | numpy.dtype, optional
+            output dtype for numpy arrays such as float32 (other inputs raise)
+        bounds : str, optional
+            bounds policy: 'mask', 'clip', 'nan' or 'raise' (see `convert`)
         '''
         try:
             # convert
-            return self.convert(value, from_unit, to_unit, reference)
+            return self.convert(value, from_unit, to_unit, reference, out=out, dtype=dtype,
+                                bounds=bounds)
         except Exception as e:
             raise Exception('Conversion failed!, ', e)
 
-    def convert(self, value, from_unit, to_unit, reference=None):
+    def ufunc(self, unit_conversion_block, reference=None):
+        '''
+        Compiles a unit conversion block into a ufunc-like converter
+
+        Parameters
+        ----------
+        unit_conversion_block : str
+            unit conversion block such as `psi => kPa`
+        reference : str
+            reference name such as PRESSURE, TEMPERATURE, CUSTOM
+
+        Returns
+        -------
+        UnitUfunc
+            converter for numpy, dask and xarray values
+
+        Examples
+        --------
+        >>> psi_to_kpa = cucx.ufunc('psi => kPa')
+        >>> psi_to_kpa(np.array([14.7, 30.0]))
+        >>> # dask (lazy)
+        >>> dask_array.map_blocks(psi_to_kpa)
+        >>> # xarray (attrs['units'] is updated)
+        >>> psi_to_kpa(data_array)
+        '''
+        try:
+            # plugin families
+            if self._families:
+                from_unit, _, to_unit = self.check_conversion_block(
+                    unit_conversion_block)
+                family = self._plugin_family(from_unit, to_unit, reference)
+                if family is not None:
+                    return UnitUfunc(from_unit, to_unit, 1.0, 0.0, family=family)
+
+            # compile
+            from_unit, to_unit, scale, offset = self.compile_block(
+                unit_conversion_block, reference)
+
+            return UnitUfunc(from_unit, to_unit, scale, offset)
+        except Exception as e:
+            raise Exception('Compiling conversion failed!, ', e)
+
+    def convert_file(self, src, dst, block, dtype='<f8', out_dtype=None, chunk_size=None, reference=None):
+        '''
+        Converts a binary file of values through memory maps
+
+        Parameters
+        ----------
+        src : str
+            source file path (.npy or raw binary such as .bin)
+        dst : str
+            destination file path, `dst == src` converts in place
+        block : str
+            unit conversion block such as `psi => kPa`
+        dtype : str | numpy.dtype
+            dtype of raw binary source files (default: little-endian float64)
+        out_dtype : str | numpy.dtype, optional
+            dtype of the destination (default: source dtype)
+        chunk_size : int, optional
+            chunk size in bytes (default: 16 MiB)
+        reference : str
+            reference name such as PRESSURE, TEMPERATURE, CUSTOM
+
+        Returns
+        -------
+        int
+            number of converted values
+
+        Examples
+        --------
+        >>> cucx.convert_file('p.bin', 'p-kpa.bin', 'psi => kPa', dtype='<f4')
+        >>> # in place
+        >>> cucx.convert_file('p.npy', 'p.npy', 'psi => kPa')
+        '''
+        try:
+            # plugin families (vectorized kernel per chunk)
+            res = self._block_family(block, reference)
+            if res is not None:
+                from_unit, to_unit, family = res
+                return _convert_file(
+                    src, dst, 1.0, 0.0, dtype=dtype, out_dtype=out_dtype, chunk_size=chunk_size,
+                    kernel=lambda x, out: family.convert_array(x, from_unit, to_unit, out=out))
+
+            # compile
+            _, _, scale, offset = self.compile_block(block, reference)
+
+            # convert
+            return _convert_file(src, dst, scale, offset, dtype=dtype,
+                                 out_dtype=out_dtype, chunk_size=chunk_size)
+        except Exception as e:
+            raise Exception('Conversion failed!, ', e)
+
+    def record_converter(self, schema, reference=None, batch_size=1024):
+        '''
+        Compiles a field -> unit conversion schema for JSON records
+
+        Parameters
+        ----------
+        schema : dict
+            JSON path -> unit conversion block such as `{'$.sensor.p': 'psi => kPa'}`
+        reference : str
+            reference name such as PRESSURE, TEMPERATURE, CUSTOM
+        batch_size : int
+            records converted per batch when streaming
+
+        Returns
+        -------
+        RecordConverter
+            call `convert_records(records)` or `stream(src, dst)`
+
+        Examples
+        --------
+        >>> rc = cucx.record_converter({'pressure': 'psi => kPa', 'temp.value': 'F => C'})
+        >>> rc.stream('readings.ndjson', 'readings-si.ndjson')
+        '''
+        try:
+            # compile once
+            fields = [(parse_path(path), self.ufunc(block, reference))
+                      for path, block in schema.items()]
+
+            return RecordConverter(fields, batch_size=batch_size)
+        except Exception as e:
+            raise Exception('Compiling record schema failed!, ', e)
+
+    def compile_record(self, schema, reference=None):
+        '''
+        Resolves the blocks of a structured array schema once
+
+        Parameters
+        ----------
+        schema : dict
+            field -> unit conversion block such as `{'p': 'psi => kPa', 't': 'F => C'}`,
+            nested fields as `'frame.p'`
+        reference : str
+            reference name such as PRESSURE, TEMPERATURE, CUSTOM
+
+        Returns
+        -------
+        tuple
+            `(field path, from_unit, to_unit, scale, offset, family)` per field
+
+        Notes
+        ------
+        1. Compiled schemas are cached until the custom units change.
+        '''
+        try:
+            # cache (kept for the save, reloads swap in a new one)
+            cache = self._record_cache
+            key = (tuple(schema.items()), reference)
+            res = cache.get(key)
+            if res is not None:
+                return res
+
+            fields = []
+            for field, block in schema.items():
+                # interpret the unit conversion block
+                from_unit, _, to_unit = self.check_conversion_block(block)
+                path = tuple(str(field).split('.'))
+
+                # plugin families
+                family = self._plugin_family(
+                    from_unit, to_unit, reference) if self._families else None
+                if family is not None:
+                    fields.append((path, from_unit, to_unit, 1.0, 0.0, family))
+                    continue
+
+                scale, offset = self.conversion_factors(
+                    from_unit, to_unit, reference)
+                fields.append((path, from_unit, to_unit, scale, offset, None))
+
+            # save
+            res = tuple(fields)
+            cache[key] = res
+
+            return res
+        except Exception as e:
+            raise Exception('Compiling record schema failed!, ', e)
+
+    def convert_record(self, arr, schema, reference=None):
+        '''
+        Converts fields of a numpy structured array in place
+
+        Parameters
+        ----------
+        arr : numpy.ndarray
+            structured array (such as decoded telemetry frames)
+        schema : dict | tuple
+            field -> unit conversion block, or a schema compiled by `compile_record`
+        reference : str
+            reference name such as PRESSURE, TEMPERATURE, CUSTOM
+
+        Returns
+        -------
+        numpy.ndarray
+            arr (converted in place)
+
+        Notes
+        ------
+        1. Each field is converted through its strided view, without copies and without a loop over rows.
+        2. Converted fields must be floating point, copy the array first to keep the original values.
+        3. All fields are resolved and checked first, an invalid schema leaves the array unchanged.
+
+        Examples
+        --------
+        >>> frames = np.frombuffer(buffer, dtype=[('p', '<f8'), ('t', '<f4'), ('id', '<i4')]).copy()
+        >>> cucx.convert_record(frames, {'p': 'psi => kPa', 't': 'F => C'})
+        '''
+        try:
+            # check
+            if not isinstance(arr, np.ndarray) or arr.dtype.names is None:
+                raise TypeError('arr must be a numpy structured array')
+            if not arr.flags.writeable:
+                raise ValueError('Structured array is read-only')
+
+            # compile
+            fields = self.compile_record(schema, reference) if isinstance(
+                schema, dict) else schema
+
+            # strided field views (all fields checked before any is changed)
+            views = []
+            for path, _, _, _, _, _ in fields:
+                view = arr
+                for name in path:
+                    if view.dtype.names is None or name not in view.dtype.names:
+                        raise KeyError(f"Field '{'.'.join(path)}' not found")
+                    view = view[name]
+                if not np.issubdtype(view.dtype, np.floating):
+                    raise TypeError(
+                        f"Field '{'.'.join(path)}' must be floating, got {view.dtype}")
+                views.append(view)
+
+            for view, (_, from_unit, to_unit, scale, offset, family) in zip(views, fields):
+                # convert in place
+                if family is not None:
+                    family.convert_array(view, from_unit, to_unit, out=view)
+                else:
+                    convert_array(view, scale, offset, out=view)
+
+            return arr
+        except Exception as e:
+            raise Exception('Record conversion failed!, ', e)
+
+    def plan_headers(self, headers, targets, reference=None):
+        '''
+        Builds a column conversion plan from unit-annotated headers
+
+        Parameters
+        ----------
+        headers : list
+            headers such as `Pressure [psi]`, `T (degF)`, `Cp_kJ/kmol.K`
+        targets : dict
+            target units by header, column name or reference such as
+            `{'PRESSURE': 'kPa', 'TEMPERATURE': 'C', 'Flow': 'm3/h'}`
+        reference : str
+            reference name such as PRESSURE, TEMPERATURE, CUSTOM
+
+        Returns
+        -------
+        HeaderPlan
+            plan, call `apply(dataframe)`
+
+        Notes
+        ------
+        1. Units are read from `[unit]`, `(unit)`, `{unit}`, `in unit`, `, unit` and `_unit` suffixes, with aliases such as `degF`.
+        2. Plans are cached per header layout until the units change.
+        3. Columns without a known unit or without a target are left out.
+        '''
+        try:
+            # cache (kept for the save, reloads swap in a new one)
+            cache = self._plan_cache
+            headers = tuple(headers)
+            key = (headers, tuple(sorted(targets.items())), reference)
+            plan = cache.get(key)
+            if plan is not None:
+                return plan
+
+            # units of the loaded references
+            index = self.search_index()
+
+            columns = []
+            for header in headers:
+                # parse
+                name, from_unit = parse_header(header, index.__contains__)
+                if from_unit is None:
+                    continue
+
+                # target: header, name, then reference of the unit
+                to_unit = targets.get(header) or targets.get(name)
+                if to_unit is None:
+                    for ref in index.references(from_unit):
+                        ref = ref.split('::')[-1]
+                        to_unit = targets.get(ref) or targets.get(ref.upper())
+                        if to_unit is not None:
+                            break
+                if to_unit is None or to_unit == from_unit:
+                    continue
+
+                # plugin families
+                family = self._plugin_family(
+                    from_unit, to_unit, reference) if self._families else None
+                if family is not None:
+                    columns.append(
+                        (header, name, from_unit, to_unit, 1.0, 0.0, family))
+                    continue
+
+                # factors
+                scale, offset = self.conversion_factors(
+                    from_unit, to_unit, reference)
+                columns.append(
+                    (header, name, from_unit, to_unit, scale, offset, None))
+
+            # save
+            plan = HeaderPlan(columns, headers)
+            cache[key] = plan
+
+            return plan
+        except Exception as e:
+            raise Exception('Planning header conversion failed!, ', e)
+
+    def convert_columns(self, data, targets, reference=None, rename=False):
+        '''
+        Converts the unit-annotated columns of a table
+
+        Parameters
+        ----------
+        data : pandas.DataFrame | dict
+            table, or column -> array
+        targets : dict
+            target units by header, column name or reference (see `plan_headers`)
+        reference : str
+            reference name such as PRESSURE, TEMPERATURE, CUSTOM
+        rename : bool
+            rename converted columns to `Name [to_unit]`
+
+        Returns
+        -------
+        pandas.DataFrame | dict
+            converted table
+
+        Examples
+        --------
+        >>> df = pd.read_csv('vendor.csv')  # 'Pressure [psi]', 'T (degF)', ...
+        >>> cucx.convert_columns(df, {'PRESSURE': 'kPa', 'TEMPERATURE': 'C'}, rename=True)
+        '''
+        try:
+            # plan (cached per layout)
+            plan = self.plan_headers(list(data.keys()) if isinstance(data, dict) else
+                                     list(data.columns), targets, reference)
+
+            return plan.apply(data, rename=rename)
+        except Exception as e:
+            raise Exception('Converting columns failed!, ', e)
+
+    def convert(self, value, from_unit, to_unit, reference=None, out=None, dtype=None, bounds=None):
         '''
         Selects the conversion function
 
         Parameters
         ----------
-        value: float
+        value: float | numpy.ndarray
             value
         from_unit : str
             from unit
@@ -212,8 +910,96 @@ class CustomUnitConverterX(Utils, Refs):
             to unit
         reference : str
             reference name such as PRESSURE, TEMPERATURE, CUSTOM
+        out : numpy.ndarray, optional
+            output array for array values, `out=value` converts in place
+        dtype : str | numpy.dtype, optional
+            output dtype for numpy arrays such as float32 (other inputs raise)
+        bounds : str, optional
+            check the physical bounds of the reference (see `set_bounds`) in the same pass:
+            'mask' returns `(values, valid)`, 'clip' clips, 'nan' sets NaN, 'raise' raises
+
+        Notes
+        ------
+        1. pyarrow arrays, chunked arrays and arrow-backed pandas series are converted with arrow compute kernels, nulls are preserved.
+        2. numpy arrays are converted with numpy ufuncs, a read-only `out` raises an error.
+        3. Registered families (see `register_family`) use their own kernels.
+        4. `bounds` supports scalars and numpy arrays only (other inputs such as arrow arrays raise), they are converted through numpy.
+        5. `dtype` applies to numpy arrays (or with `out`), other inputs raise a ValueError.
+        '''
+        try:
+            # check
+            if dtype is not None and out is None and not is_array(value):
+                raise ValueError(
+                    f'dtype is only supported for numpy arrays, got {type(value).__name__}')
+
+            # bounds
+            if bounds is not None:
+                return self._convert_bounded(value, from_unit, to_unit, reference, out, dtype, bounds)
+
+            # plugin families
+            if self._families:
+                family = self._plugin_family(from_unit, to_unit, reference)
+                if family is not None:
+                    return family.convert(value, from_unit, to_unit, out=out, dtype=dtype)
+
+            # numpy arrays
+            if is_array(value) or out is not None:
+                scale, offset = self.conversion_factors(
+                    from_unit, to_unit, reference)
+                return convert_array(value, scale, offset, out=out, dtype=dtype)
+
+            # arrow arrays
+            if is_arrow(value):
+                scale, offset = self.conversion_factors(
+                    from_unit, to_unit, reference)
+                return convert_arrow(value, scale, offset)
+
+            # arrow-backed pandas series
+            if is_arrow_series(value):
+                scale, offset = self.conversion_factors(
+                    from_unit, to_unit, reference)
+                return convert_arrow_series(value, scale, offset)
+
+            # scalars: resolved (cached) factors, one multiply
+            scale, offset = self.conversion_factors(
+                from_unit, to_unit, reference)
+            if offset != 0:
+                return float(value) * scale + offset
+            return float(value) * scale
+        except Exception as e:
+            raise Exception('Setting conversion function failed!, ', e)
+
+    def conversion_factors(self, from_unit, to_unit, reference=None):
+        '''
+        Resolves a conversion as `value * scale + offset`
+
+        Parameters
+        ----------
+        from_unit : str
+            from unit
+        to_unit : str
+            to unit
+        reference : str
+            reference name such as PRESSURE, TEMPERATURE, CUSTOM
+
+        Returns
+        -------
+        scale : float
+            scale factor
+        offset : float
+            offset (zero except for temperature)
+
+        Notes
+        ------
+        1. Resolved factors are cached until the custom units change.
         '''
         try:
+            # cache (kept for the save, reloads swap in a new one)
+            cache = self._conversion_factors_cache
+            key = (from_unit, to_unit, reference)
+            if key in cache:
+                return cache[key]
+
             # find reference
             if reference is None:
                 reference = self.find_reference(from_unit, to_unit)
@@ -221,34 +1007,335 @@ class CustomUnitConverterX(Utils, Refs):
             # upper
             reference = reference.upper()
 
-            # reference
-            ref = {
-                'PRESSURE': self._pressure_conversions,
-                'TEMPERATURE': self._temperature_conversions,
-                'CUSTOM': self._custom_conversions
-            }
-
-            # check
-            if reference not in ref.keys():
+            if reference == 'PRESSURE':
+                scale = float(self._pressure_conversions[to_unit]) / \
+                    float(self._pressure_conversions[from_unit])
+                offset = 0.0
+            elif reference == 'TEMPERATURE':
+                # celsius = value * a + b
+                a_from, b_from = self._temperature_to_celsius(from_unit)
+                a_to, b_to = self._temperature_to_celsius(to_unit)
+                scale = a_from / a_to
+                offset = (b_from - b_to) / a_to
+            elif reference in CATALOG:
+                group = CATALOG.group(reference)
+                scale = group[to_unit] / group[from_unit]
+                offset = 0.0
+            elif reference == 'CUSTOM':
+                # looping through all keys in _custom_conversions_full
+                for _, custom_unit_dict in self._custom_conversions_full.items():
+                    if from_unit in custom_unit_dict and to_unit in custom_unit_dict:
+                        scale = float(custom_unit_dict[to_unit]) / \
+                            float(custom_unit_dict[from_unit])
+                        offset = 0.0
+                        break
+                else:
+                    raise ValueError("Custom conversion units not found")
+            else:
                 raise Exception('Reference not found')
 
-            # reference
-            ref_methods = {
-                'PRESSURE': lambda x, y, z: self.convert_pressure(x, y, z),
-                'TEMPERATURE': lambda x, y, z: self.convert_temperature(x, y, z),
-                'CUSTOM': lambda x, y, z: self.convert_custom(x, y, z)
-            }
+            # save
+            cache[key] = (scale, offset)
+
+            return scale, offset
+        except Exception as e:
+            raise Exception('Resolving conversion factors failed!, ', e)
+
+    @classmethod
+    def set_bounds(cls, reference, unit, lower=None, upper=None):
+        '''
+        Sets the physical bounds of a reference
 
+        Parameters
+        ----------
+        reference : str
+            reference name such as PRESSURE, TEMPERATURE, a custom group or a catalog family
+        unit : str
+            unit of the bounds
+        lower : float, optional
+            lower bound (None: unbounded)
+        upper : float, optional
+            upper bound (None: unbounded)
+
+        Returns
+        -------
+        tuple
+            (unit, lower, upper)
+
+        Examples
+        --------
+        >>> cucx.set_bounds('TEMPERATURE', 'C', -100, 1500)
+        '''
+        try:
             # check
-            if reference not in ref_methods:
-                raise Exception('Reference not found')
+            check_not_frozen(cls)
+            res = parse_bounds(reference, {'unit': unit, 'min': lower, 'max': upper})
 
             # set
-            res = ref_methods[reference](value, from_unit, to_unit)
+            cls._bounds[str(reference).strip().upper()] = res
+            cls._bounds_cache.clear()
+            cls._fingerprint = None
 
             return res
         except Exception as e:
-            raise Exception('Setting conversion function failed!, ', e)
+            raise Exception('Setting bounds failed!, ', e)
+
+    def _set_bounds_section(self, section):
+        '''
+        Sets the bounds of a reference file (`BOUNDS` key)
+        '''
+        for group, value in (section or {}).items():
+            self._bounds[str(group).strip().upper()] = parse_bounds(group, value)
+        self._bounds_cache.clear()
+        type(self)._fingerprint = None
+
+    def conversion_bounds(self, from_unit, to_unit, reference=None):
+        '''
+        Returns the bounds of a conversion in the target unit
+
+        Parameters
+        ----------
+        from_unit : str
+            from unit
+        to_unit : str
+            to unit
+        reference : str
+            reference name such as PRESSURE, TEMPERATURE, CUSTOM
+
+        Returns
+        -------
+        tuple | None
+            (lower, upper) in `to_unit`, None if the reference has no bounds
+        '''
+        try:
+            # cache (kept for the save, reloads swap in a new one)
+            cache = self._bounds_cache
+            key = (from_unit, to_unit, reference)
+            if key in cache:
+                return cache[key]
+
+            # reference
+            name = (reference if reference is not None else
+                    self.find_reference(from_unit, to_unit)).upper()
+            # group of the units (custom groups come before the catalog and families)
+            custom = False
+            for group, units in self._custom_conversions_full.items():
+                if from_unit in units and to_unit in units and \
+                        name in ('CUSTOM', str(group).upper()):
+                    name, custom = str(group).upper(), True
+                    break
+
+            # bounds (a custom group and a catalog family of the same name keep
+            # the bounds given in their own units)
+            bounds = self._bounds.get(name)
+            if custom:
+                family = None
+                if bounds is not None and bounds[0] not in units:
+                    bounds = None
+            else:
+                family = self._families.get(name)
+                for group, units in self._custom_conversions_full.items():
+                    if bounds is not None and str(group).upper() == name and bounds[0] in units:
+                        bounds = None
+                bounds = bounds or self.bounds_ref.get(name)
+            res = None
+            if bounds is not None and family is not None:
+                # nonlinear families: convert the bounds (monotonic kernels)
+                unit, lower, upper = bounds
+                bound = lower if lower is not None else upper
+                if unit != to_unit and bound is not None:
+                    def convert(v):
+                        return family.scalar(v, unit, to_unit)
+                    # decreasing kernels swap the bounds
+                    step = 1e-6 * max(1.0, abs(bound))
+                    decreasing = convert(bound + step) < convert(bound)
+                    lower = None if lower is None else convert(lower)
+                    upper = None if upper is None else convert(upper)
+                    if decreasing:
+                        lower, upper = upper, lower
+                res = (lower, upper)
+            elif bounds is not None:
+                unit, lower, upper = bounds
+                scale, offset = self.conversion_factors(
+                    unit, to_unit, name if not custom and (
+                        name in ('PRESSURE', 'TEMPERATURE') or name in CATALOG) else 'CUSTOM')
+                lower = None if lower is None else lower * scale + offset
+                upper = None if upper is None else upper * scale + offset
+                # decreasing maps swap the bounds
+                res = (lower, upper) if scale > 0 else (upper, lower)
+
+            # save
+            cache[key] = res
+
+            return res
+        except Exception as e:
+            raise Exception('Resolving bounds failed!, ', e)
+
+    def _convert_bounded(self, value, from_unit, to_unit, reference, out, dtype, policy):
+        '''
+        Converts scalars and numpy arrays and checks bounds in the same pass
+        '''
+        # check (arrow arrays, series and lists are not supported)
+        if not (is_array(value) or isinstance(value, (int, float, np.number))) or \
+                isinstance(value, bool):
+            raise TypeError(
+                f'bounds supports scalars and numpy arrays, got {type(value).__name__}')
+
+        # plugin families (vectorized kernel per block)
+        family = self._plugin_family(
+            from_unit, to_unit, reference) if self._families else None
+        if family is not None:
+            scale, offset = 1.0, 0.0
+
+            def kernel(x, res):
+                family.convert_array(x, from_unit, to_unit, out=res)
+        else:
+            scale, offset = self.conversion_factors(from_unit, to_unit, reference)
+            kernel = None
+
+        # bounds
+        lower, upper = self.conversion_bounds(
+            from_unit, to_unit, reference) or (None, None)
+
+        # scalar
+        if not is_array(value) and out is None:
+            res = convert_array_bounded(
+                np.asarray(float(value)), scale, offset, lower, upper, policy, kernel=kernel)
+            if policy == 'mask':
+                return float(res[0]), bool(res[1])
+            return float(res)
+
+        return convert_array_bounded(value, scale, offset, lower, upper, policy,
+                                     out=out, dtype=dtype, kernel=kernel)
+
+    def compile_block(self, unit_conversion_block, reference=None):
+        '''
+        Parses a unit conversion block and resolves its factors
+
+        Parameters
+        ----------
+        unit_conversion_block : str
+            unit conversion block such as `psi => kPa`
+        reference : str
+            reference name such as PRESSURE, TEMPERATURE, CUSTOM
+
+        Returns
+        -------
+        tuple
+            (from_unit, to_unit, scale, offset)
+
+        Notes
+        ------
+        1. Compiled blocks are cached per block string until the custom units change.
+        '''
+        try:
+            # cache (kept for the save, reloads swap in a new one)
+            cache = self._block_cache
+            key = (unit_conversion_block, reference)
+            res = cache.get(key)
+            if res is not None:
+                return res
+
+            # interpret the unit conversion block
+            from_unit, _, to_unit = self.check_conversion_block(
+                unit_conversion_block)
+
+            # factors
+            scale, offset = self.conversion_factors(
+                from_unit, to_unit, reference)
+
+            # save
+            res = (from_unit, to_unit, scale, offset)
+            cache[key] = res
+
+            return res
+        except Exception as e:
+            raise Exception('Compiling conversion block failed!, ', e)
+
+    @classmethod
+    def _reset_caches(cls):
+        '''
+        Clears resolved factors and compiled blocks (custom units changed)
+        '''
+        cls._registry_version += 1
+        cls._conversion_factors_cache.clear()
+        cls._block_cache.clear()
+        cls._family_cache.clear()
+        cls._bounds_cache.clear()
+        cls._record_cache.clear()
+        cls._plan_cache.clear()
+
+    @classmethod
+    def _invalidate_units(cls, units):
+        '''
+        Drops resolved factors and compiled blocks of the given units
+
+        Parameters
+        ----------
+        units : set
+            changed unit symbols
+
+        Notes
+        ------
+        1. The caches are replaced by filtered copies, a conversion running
+           concurrently saves its result in the retired cache.
+        '''
+        # check
+        if not units:
+            return
+
+        # reference views, bounds and record schemas
+        cls._registry_version += 1
+        cls._bounds_cache = {}
+        cls._record_cache = {}
+        cls._plan_cache = {}
+
+        # factors: (from_unit, to_unit, reference)
+        cls._conversion_factors_cache = {
+            k: v for k, v in list(cls._conversion_factors_cache.items())
+            if k[0] not in units and k[1] not in units}
+
+        # blocks: (from_unit, to_unit, scale, offset)
+        cls._block_cache = {
+            k: v for k, v in list(cls._block_cache.items())
+            if v[0] not in units and v[1] not in units}
+
+        # families: (from_unit, to_unit, reference)
+        cls._family_cache = {
+            k: v for k, v in list(cls._family_cache.items())
+            if k[0] not in units and k[1] not in units}
+
+    @classmethod
+    def _swap_registry(cls, groups):
+        '''
+        Installs a new custom registry in one step (groups are never changed in place after)
+        '''
+        cls._custom_conversions_full = groups
+        cls._custom_conversions = groups['CUSTOM']
+
+    def _temperature_to_celsius(self, unit):
+        '''
+        Returns the affine map of a temperature unit to Celsius
+
+        Parameters
+        ----------
+        unit : str
+            temperature unit
+
+        Returns
+        -------
+        tuple
+            (a, b) such that celsius = value * a + b
+        '''
+        # ref
+        ref = self._temperature_conversions[unit]
+
+        if unit in ('F', 'R'):
+            return 5/9, -ref * 5/9
+        elif unit == 'K':
+            return 1.0, float(ref)
+        else:  # unit == 'C'
+            return 1.0, 0.0
 
     def convert_pressure(self, value, from_unit, to_unit):
         '''
@@ -270,7 +1357,7 @@ class CustomUnitConverterX(Utils, Refs):
         '''
         try:
             # res
-            return float(value) / float(self._pressure_conversions[from_unit]) * float(self._pressure_conversions[to_unit])
+            return float(value) / self._pressure_conversions[from_unit] * self._pressure_conversions[to_unit]
         except Exception as e:
             raise Exception('Pressure conversion failed!, ', e)
 
@@ -337,12 +1424,54 @@ class CustomUnitConverterX(Utils, Refs):
             True if successful
         '''
         try:
+            # check
+            check_not_frozen(self)
+
+            # validate (coerced once to float)
+            unit = str(unit).strip()
+            factor, problem = check_factor(conversion_factor)
+            if problem is None and len(unit) == 0:
+                problem = 'empty unit symbol'
+            if problem is not None:
+                raise FactorValidationError([{'source': None, 'group': 'CUSTOM', 'unit': unit,
+                                              'value': conversion_factor, 'problem': problem}])
+
             # add
-            self._custom_conversions[unit] = conversion_factor
+            self._custom_conversions[unit] = factor
+            self._index_units('custom::CUSTOM', new=[unit])
+            # reset resolved factors
+            self._reset_caches()
             return True
+        except FactorValidationError:
+            raise
         except Exception as e:
             raise Exception('Adding new unit failed!, ', e)
 
+    def validate_custom_unit(self, f):
+        '''
+        Lists the problems of the unit factors in a reference file
+
+        Parameters
+        ----------
+        f : str
+            reference file path (includes are followed)
+
+        Returns
+        -------
+        list
+            `{'source', 'group', 'unit', 'value', 'problem'}` per problem, empty if valid
+
+        Examples
+        --------
+        >>> for problem in cucx.validate_custom_unit('custom-unit.yml'):
+        >>>     print(problem['group'], problem['unit'], problem['problem'])
+        '''
+        try:
+            groups, order, _, _ = load_layers([f])
+            return validate_groups(groups, ', '.join(order))[1]
+        except Exception as e:
+            raise Exception('Validating custom unit failed!, ', e)
+
     def load_custom_unit(self, f):
         '''
         Load custom unit
@@ -358,6 +1487,9 @@ class CustomUnitConverterX(Utils, Refs):
             custom unit
         '''
         try:
+            # check
+            check_not_frozen(self)
+
             # update
             self.reference_file = f
 
@@ -368,19 +1500,346 @@ class CustomUnitConverterX(Utils, Refs):
             if len(custom_unit) == 0:
                 return False
 
+            # include directive
+            if any(str(k).strip().lower() == INCLUDE_KEY for k in custom_unit):
+                return self.load_custom_units([f])
+
             # check key 'CUSTOM-UNIT'
             if 'CUSTOM-UNIT' not in custom_unit.keys():
                 raise ValueError("Key 'CUSTOM-UNIT' not found")
 
+            # validate (all problems of the file at once)
+            groups, problems = validate_groups(custom_unit['CUSTOM-UNIT'], f)
+            if problems:
+                raise FactorValidationError(problems)
+
             # update custom conversion
-            for key, value in custom_unit['CUSTOM-UNIT'].items():
-                self._custom_conversions_full[str(key).strip()] = value
+            source = os.path.abspath(f)
+            for key, value in groups.items():
+                self._set_group(key, value, source)
+            self._layer_stacks[(source,)] = (source,)
+            self._set_bounds_section(custom_unit.get(BOUNDS_KEY))
+
+            # reset resolved factors
+            self._reset_caches()
 
             return self._custom_conversions_full
 
+        except FactorValidationError:
+            raise
         except Exception as e:
             raise Exception('Loading custom unit failed!, ', e)
 
+    def load_custom_units(self, files, max_workers=None, cache_dir=None):
+        '''
+        Load layered reference files
+
+        Parameters
+        ----------
+        files : list
+            reference files from base to most specific layer
+        max_workers : int, optional
+            parser processes (default: parse in this process)
+        cache_dir : str, optional
+            folder to keep merged results between runs
+
+        Returns
+        -------
+        dict
+            custom unit
+
+        Notes
+        ------
+        1. Files and their `include:` directives are merged in order, later layers win.
+        2. `replace: [GROUP, ...]` in a layer replaces a group instead of merging its units.
+        '''
+        try:
+            # check
+            check_not_frozen(self)
+
+            # merged layers
+            groups, order, bounds, owners = load_layers(
+                files, max_workers=max_workers, cache_dir=cache_dir)
+
+            # validate
+            groups, problems = validate_groups(groups, ', '.join(order))
+            if problems:
+                raise FactorValidationError(problems)
+
+            # update custom conversion
+            for key, value in groups.items():
+                self._set_group(key, value, owners[key])
+            self._layer_stacks[tuple(os.path.abspath(f) for f in files)] = tuple(order)
+            self._set_bounds_section(bounds)
+
+            # update
+            self.reference_file = files[-1] if len(files) > 0 else None
+
+            # reset resolved factors
+            self._reset_caches()
+
+            return self._custom_conversions_full
+        except FactorValidationError:
+            raise
+        except Exception as e:
+            raise Exception('Loading custom units failed!, ', e)
+
+    def _set_group(self, group, units, source):
+        '''
+        Sets a custom group loaded from a reference file
+        '''
+        # search index
+        old = self._custom_conversions_full.get(group, {})
+        self._index_units(f'custom::{group}', old=old, new=units)
+
+        # set
+        self._custom_conversions_full[group] = units
+        self._loaded_groups[group] = source
+
+    @classmethod
+    def _index_units(cls, reference, old=(), new=()):
+        '''
+        Updates the search index (if built) for a reference
+        '''
+        # check
+        index = cls._search_index
+        if index is None:
+            return
+
+        for unit in old:
+            if unit not in new:
+                index.remove(unit, reference)
+        for unit in new:
+            index.add(unit, reference)
+
+    @classmethod
+    def search_index(cls):
+        '''
+        Returns the unit search index, built on first use
+
+        Returns
+        -------
+        UnitSearchIndex
+            index over built-in, catalog, custom and family units
+        '''
+        # check
+        if cls._search_index is not None:
+            return cls._search_index
+
+        index = UnitSearchIndex()
+        # built-in references
+        for unit in cls._pressure_conversions_ref:
+            index.add(unit, 'PRESSURE')
+        for unit in cls._temperature_conversions_ref:
+            index.add(unit, 'TEMPERATURE')
+        # catalog (symbols only, families are not materialized)
+        for family in CATALOG:
+            for unit in CATALOG.symbols(family):
+                index.add(unit, family)
+        # custom groups
+        for group, units in cls._custom_conversions_full.items():
+            for unit in units:
+                index.add(unit, f'custom::{group}')
+        # plugin families
+        for name, family in cls._families.items():
+            for unit in family.units or ():
+                index.add(unit, name)
+
+        cls._search_index = index
+        return index
+
+    def search_units(self, query, limit=20, fuzzy=True):
+        '''
+        Searches unit symbols by prefix, or by similarity if none matches
+
+        Parameters
+        ----------
+        query : str
+            symbol or prefix such as `kJ/`
+        limit : int
+            max number of results
+        fuzzy : bool
+            return similar symbols (trigram match) if no symbol starts with query
+
+        Returns
+        -------
+        list
+            `(unit, [references])` tuples
+
+        Examples
+        --------
+        >>> cucx.search_units('kJ/')
+        >>> cucx.search_units('kPaa')
+        '''
+        try:
+            # index
+            index = self.search_index()
+
+            # prefix
+            res = index.prefix(query, limit)
+
+            # similar (no prefix match)
+            if fuzzy and not res:
+                res = index.similar(query, limit)
+
+            return [(unit, index.references(unit)) for unit in res]
+        except Exception as e:
+            raise Exception('Searching units failed!, ', e)
+
+    def suggest_units(self, unit, limit=3):
+        '''
+        Returns the nearest known symbols of a unit
+
+        Parameters
+        ----------
+        unit : str
+            unit symbol
+        limit : int
+            max number of symbols
+
+        Returns
+        -------
+        list
+            symbols
+        '''
+        return self.search_index().similar(unit, limit)
+
+    def reload_custom_unit(self, f):
+        '''
+        Reloads a reference file and applies only the differences
+
+        Parameters
+        ----------
+        f : str | list
+            reference file path (or the files of a layered load)
+
+        Returns
+        -------
+        dict
+            reload event: file, added/changed/removed `(group, unit)` pairs,
+            removed groups and load/apply/total time in seconds
+
+        Notes
+        ------
+        1. `include:` directives are followed, the diff is made against the merged layers. Groups previously loaded from these layers and missing in the new layers are removed.
+        2. Cached factors are dropped only for the affected units.
+        3. The new registry is built aside and swapped in at once, so concurrent conversions see either the old or the new units.
+        '''
+        try:
+            # check
+            check_not_frozen(self)
+
+            # start
+            start = time.perf_counter()
+
+            # load (layers and includes)
+            files = [f] if isinstance(f, (str, os.PathLike)) else list(f)
+            (groups, order, bounds, owners), load_time = timed(load_layers, files)
+            groups, problems = validate_groups(groups, ', '.join(order))
+            if problems:
+                raise FactorValidationError(problems)
+            self._set_bounds_section(bounds)
+
+            # diff: groups owned by the previous or the new layers
+            key = tuple(os.path.abspath(file) for file in files)
+            layers = set(self._layer_stacks.get(key, key)) | set(order)
+            owned = [group for group, src in self._loaded_groups.items()
+                     if src in layers]
+            diff = diff_reference(self._custom_conversions_full, groups, owned)
+
+            # apply on copies of the changed groups (conversions running in
+            # other threads keep reading the current registry)
+            apply_start = time.perf_counter()
+            full = dict(self._custom_conversions_full)
+            touched = {group for group, _ in
+                       diff['added'] + diff['changed'] + diff['removed']}
+            for group in touched:
+                full[group] = dict(full.get(group, {}))
+            for group, unit in diff['removed']:
+                full[group].pop(unit, None)
+            for group in diff['removed_groups']:
+                if group != 'CUSTOM':
+                    full.pop(group, None)
+                self._loaded_groups.pop(group, None)
+            for group, unit in diff['added'] + diff['changed']:
+                full[group][unit] = groups[group][unit]
+            for group in groups:
+                self._loaded_groups[group] = owners[group]
+            self._layer_stacks[key] = tuple(order)
+
+            # swap
+            self._swap_registry(full)
+
+            # search index
+            for group, unit in diff['removed']:
+                self._index_units(f'custom::{group}', old=[unit])
+            for group, unit in diff['added']:
+                self._index_units(f'custom::{group}', new=[unit])
+
+            # invalidate
+            self._invalidate_units(
+                {unit for _, unit in diff['added'] + diff['changed'] + diff['removed']})
+
+            # event
+            end = time.perf_counter()
+            event = {'file': f, **diff,
+                     'load_time': load_time,
+                     'apply_time': end - apply_start,
+                     'total_time': end - start}
+
+            # update
+            self.reference_file = files[-1]
+
+            return event
+        except FactorValidationError:
+            raise
+        except Exception as e:
+            raise Exception('Reloading custom unit failed!, ', e)
+
+    def watch(self, reference_file=None, interval=1.0, callback=None, start=True):
+        '''
+        Watches a reference file and reloads its differences on change
+
+        Parameters
+        ----------
+        reference_file : str, optional
+            reference file path (default: the loaded reference file)
+        interval : float
+            polling interval of the modification time in seconds
+        callback : callable, optional
+            called with each reload event (see `reload_custom_unit`)
+        start : bool
+            start polling in a daemon thread, otherwise call `check()` manually
+
+        Returns
+        -------
+        ReferenceWatcher
+            watcher, call `stop()` to end polling
+
+        Examples
+        --------
+        >>> watcher = cucx.watch('custom-unit.yml', callback=print)
+        >>> ...
+        >>> watcher.stop()
+        '''
+        try:
+            # set
+            reference_file = reference_file or self.reference_file
+            if not reference_file:
+                raise ValueError('Reference file not provided')
+
+            # load once
+            if (os.path.abspath(reference_file),) not in self._layer_stacks:
+                self.reload_custom_unit(reference_file)
+
+            # watcher
+            watcher = ReferenceWatcher(
+                self, reference_file, interval=interval, callback=callback)
+
+            return watcher.start() if start else watcher
+        except Exception as e:
+            raise Exception('Watching reference file failed!, ', e)
+
     def convert_custom(self, value, from_unit, to_unit):
         '''
         Converts using custom units
@@ -405,8 +1864,39 @@ class CustomUnitConverterX(Utils, Refs):
 
                 # check
                 if from_unit in custom_unit_dict and to_unit in custom_unit_dict:
-                    return float(value) / float(custom_unit_dict[from_unit]) * float(custom_unit_dict[to_unit])
+                    return float(value) / custom_unit_dict[from_unit] * custom_unit_dict[to_unit]
 
             raise ValueError("Custom conversion units not found")
         except Exception as e:
             raise Exception('Conversion failed!, ', e)
+
+
+def _restore_converter(key, value, unit, reference_file):
+    '''
+    Unpickles a converter, installing its registry if the fingerprint differs
+    '''
+    # registry
+    cls = CustomUnitConverterX
+    if cls.registry_fingerprint() != key:
+        cls._install_registry(key, load_registry(key))
+
+    return cls(value, unit, reference_file)
+
+
+# shared converter
+_shared_converter = None
+
+
+def shared_converter():
+    '''
+    Returns the converter shared by quantities and module-level functions
+
+    Returns
+    -------
+    CustomUnitConverterX
+        shared converter (created on first call)
+    '''
+    global _shared_converter
+    if _shared_converter is None:
+        _shared_converter = CustomUnitConverterX('', '')
+    return _shared_converter
@@ -0,0 +1,125 @@
+# FACTOR VALIDATION
+# ==================
+
+# import packages/modules
+import math
+
+
+class FactorValidationError(ValueError):
+    '''
+    Raised with every problem found in unit factors
+
+    Attributes
+    ----------
+    problems : list
+        `{'source', 'group', 'unit', 'value', 'problem'}` per problem
+    '''
+
+    def __init__(self, problems):
+        self.problems = list(problems)
+        lines = [format_problem(p) for p in self.problems]
+        super().__init__(f'{len(lines)} invalid unit factor(s):\n  ' + '\n  '.join(lines))
+
+
+def format_problem(problem):
+    '''
+    Formats a problem as `source: GROUP.unit = value: problem`
+    '''
+    where = f"{problem['group']}.{problem['unit']}" if problem['unit'] is not None \
+        else str(problem['group'])
+    source = f"{problem['source']}: " if problem.get('source') else ''
+    return f"{source}{where} = {problem['value']!r}: {problem['problem']}"
+
+
+def check_factor(value):
+    '''
+    Coerces a factor to float
+
+    Parameters
+    ----------
+    value : any
+        factor (number or numeric string)
+
+    Returns
+    -------
+    tuple
+        (factor | None, problem | None)
+    '''
+    # type
+    if isinstance(value, bool) or value is None:
+        return None, 'factor must be a number'
+    try:
+        factor = float(value)
+    except (TypeError, ValueError):
+        return None, 'factor must be a number'
+
+    # value
+    if not math.isfinite(factor):
+        return None, 'factor must be finite'
+    if factor == 0:
+        return None, 'factor must not be zero'
+    if factor < 0:
+        return None, 'factor must be positive'
+
+    return factor, None
+
+
+def validate_groups(groups, source=None):
+    '''
+    Validates and coerces the factors of unit groups
+
+    Parameters
+    ----------
+    groups : dict
+        group -> {unit: factor}
+    source : str, optional
+        reference file (reported with problems)
+
+    Returns
+    -------
+    tuple
+        (groups with stripped symbols and float factors, problems)
+
+    Notes
+    ------
+    1. Problems: non-numeric, non-finite, zero or negative factors, empty symbols and
+       duplicate symbols in a group (a key repeated in the file, or `kJ` and `kJ `).
+    '''
+    res = {}
+    problems = []
+
+    def problem(group, unit, value, text):
+        problems.append({'source': source, 'group': group, 'unit': unit,
+                         'value': value, 'problem': text})
+
+    for group, units in groups.items():
+        group = str(group).strip()
+
+        # check
+        if not isinstance(units, dict):
+            problem(group, None, units, 'group must map units to factors')
+            continue
+
+        normalized = {}
+        seen = set()
+        # repeated keys kept by the loaders (see `UnitMap`)
+        pairs = list(units.items()) + list(getattr(units, 'duplicates', ()))
+        for unit, value in pairs:
+            symbol = str(unit).strip()
+            if len(symbol) == 0:
+                problem(group, unit, value, 'empty unit symbol')
+                continue
+            if symbol in seen:
+                problem(group, symbol, value, 'duplicate unit symbol')
+                continue
+            seen.add(symbol)
+
+            factor, text = check_factor(value)
+            if text is not None:
+                problem(group, symbol, value, text)
+                continue
+            normalized[symbol] = factor
+
+        res[group] = normalized
+
+    return res, problems
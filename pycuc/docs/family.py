@@ -0,0 +1,132 @@
+# CONVERSION FAMILIES
+# ====================
+
+# import packages/modules
+import numpy as np
+# local
+from .arrayx import prepare_out
+from .arrowx import is_arrow, is_arrow_series
+from . import arrowx
+
+
+class UnitFamily:
+    '''
+    A conversion family with its own kernels (such as dB, pH, API gravity)
+
+    Parameters
+    ----------
+    name : str
+        family name used as reference such as 'API-GRAVITY'
+    scalar : callable
+        `scalar(value, from_unit, to_unit) -> float`
+    vectorized : callable, optional
+        `vectorized(values, from_unit, to_unit) -> numpy.ndarray`, the scalar kernel is looped otherwise
+    units : iterable, optional
+        unit symbols of the family (indexed for O(1) lookup)
+    contains : callable, optional
+        `contains(unit) -> bool` membership test for families without a fixed unit list
+    '''
+
+    def __init__(self, name, scalar, vectorized=None, units=None, contains=None):
+        # check
+        if units is None and contains is None:
+            raise ValueError('Family needs units or a membership test')
+
+        self.name = str(name).strip().upper()
+        self.scalar = scalar
+        self.vectorized = vectorized
+        self.units = frozenset(units) if units is not None else None
+        self._contains = contains
+
+    def __repr__(self):
+        return f"<UnitFamily '{self.name}'>"
+
+    def contains(self, unit):
+        '''
+        Checks if the unit belongs to the family
+        '''
+        if self.units is not None and unit in self.units:
+            return True
+        if self._contains is not None:
+            return bool(self._contains(unit))
+        return False
+
+    def convert_array(self, values, from_unit, to_unit, out=None, dtype=None):
+        '''
+        Converts a numpy array with the vectorized (or looped scalar) kernel
+        '''
+        # set
+        values = np.asarray(values)
+
+        # kernel
+        if self.vectorized is not None:
+            res = self.vectorized(values, from_unit, to_unit)
+        else:
+            res = np.frompyfunc(
+                lambda v: self.scalar(v, from_unit, to_unit), 1, 1)(values)
+
+        # output
+        out = prepare_out(values, out, dtype)
+        out[...] = res
+
+        return out
+
+    def convert(self, value, from_unit, to_unit, out=None, dtype=None):
+        '''
+        Converts scalars, numpy arrays and arrow arrays
+
+        Parameters
+        ----------
+        value : float | numpy.ndarray | pyarrow.Array
+            value
+        from_unit : str
+            from unit
+        to_unit : str
+            to unit
+        out : numpy.ndarray, optional
+            output array for array values
+        dtype : str | numpy.dtype, optional
+            output dtype for array values
+
+        Returns
+        -------
+        float | numpy.ndarray | pyarrow.Array
+            converted value
+        '''
+        try:
+            # numpy
+            if isinstance(value, np.ndarray) or out is not None:
+                return self.convert_array(value, from_unit, to_unit, out, dtype)
+
+            # arrow (nulls are kept)
+            if is_arrow(value):
+                return self._convert_arrow(value, from_unit, to_unit)
+            if is_arrow_series(value):
+                import pandas as pd
+                res = self._convert_arrow(
+                    value.array.__arrow_array__(), from_unit, to_unit)
+                return pd.Series(pd.arrays.ArrowExtensionArray(res),
+                                 index=value.index, name=value.name, copy=False)
+
+            # scalar
+            return self.scalar(value, from_unit, to_unit)
+        except Exception as e:
+            raise Exception(f'{self.name} conversion failed!, ', e)
+
+    def _convert_arrow(self, values, from_unit, to_unit):
+        '''
+        Converts an arrow array chunk by chunk through numpy
+        '''
+        pa = arrowx.pa
+
+        # chunks
+        if isinstance(values, pa.ChunkedArray):
+            return pa.chunked_array([self._convert_arrow(chunk, from_unit, to_unit)
+                                     for chunk in values.chunks], type=pa.float64())
+
+        # nulls -> mask
+        data = values.cast(pa.float64()).to_numpy(zero_copy_only=False)
+        mask = values.is_null().to_numpy(
+            zero_copy_only=False) if values.null_count else None
+
+        return pa.array(self.convert_array(data, from_unit, to_unit), mask=mask)
@@ -0,0 +1,174 @@
+# FILE CONVERSION
+# ================
+
+# import packages/modules
+import os
+import mmap
+import numpy as np
+# local
+from .arrayx import convert_array
+
+# default chunk size in bytes (a multiple of the page size)
+CHUNK_BYTES = 1 << 24
+
+
+def _open_source(src, dtype, in_place):
+    '''
+    Memory-maps the source file (.npy or raw binary)
+
+    Parameters
+    ----------
+    src : str
+        source file path
+    dtype : str | numpy.dtype
+        dtype of raw binary files
+    in_place : bool
+        open for writing
+
+    Returns
+    -------
+    numpy.memmap
+        source values
+    '''
+    # mode
+    mode = 'r+' if in_place else 'r'
+
+    # npy
+    if str(src).endswith('.npy'):
+        return np.load(src, mmap_mode=mode)
+
+    # raw binary (np.memmap cannot map an empty file)
+    if os.path.getsize(src) == 0:
+        return np.empty(0, dtype=np.dtype(dtype))
+
+    return np.memmap(src, dtype=np.dtype(dtype), mode=mode)
+
+
+def _open_destination(dst, dtype, shape, fortran_order=False):
+    '''
+    Creates the memory-mapped destination file (.npy or raw binary)
+
+    Parameters
+    ----------
+    dst : str
+        destination file path
+    dtype : numpy.dtype
+        output dtype
+    shape : tuple
+        output shape
+    fortran_order : bool
+        memory order of the source
+
+    Returns
+    -------
+    numpy.memmap
+        destination values
+    '''
+    # npy
+    if str(dst).endswith('.npy'):
+        return np.lib.format.open_memmap(dst, mode='w+', dtype=dtype, shape=shape,
+                                         fortran_order=fortran_order)
+
+    # memory order
+    order = 'F' if fortran_order else 'C'
+
+    # raw binary (np.memmap cannot map an empty file)
+    if int(np.prod(shape)) == 0:
+        open(dst, 'wb').close()
+        return np.empty(shape, dtype=dtype, order=order)
+
+    return np.memmap(dst, dtype=dtype, mode='w+', shape=shape, order=order)
+
+
+def convert_file(src, dst, scale, offset=0.0, dtype='<f8', out_dtype=None, chunk_size=None,
+                 kernel=None):
+    '''
+    Converts a binary file through memory maps in chunks
+
+    Parameters
+    ----------
+    src : str
+        source file path (.npy or raw binary such as .bin)
+    dst : str
+        destination file path, `dst == src` converts in place
+    scale : float
+        scale factor
+    offset : float
+        offset
+    dtype : str | numpy.dtype
+        dtype of raw binary source files (default: little-endian float64), ignored for .npy
+    out_dtype : str | numpy.dtype, optional
+        dtype of the destination (default: source dtype)
+    chunk_size : int, optional
+        chunk size in bytes, rounded to a multiple of the page size (default: 16 MiB)
+    kernel : callable, optional
+        `kernel(values, out)` converting a chunk (plugin families), replaces scale and offset
+
+    Returns
+    -------
+    int
+        number of converted values
+
+    Notes
+    ------
+    1. Only the pages of the current chunk are resident, memory usage does not depend on the file size.
+    2. The destination keeps the memory order of the source (Fortran-ordered .npy files stay Fortran-ordered).
+    3. Chunks are a multiple of the page size long, they are not aligned to page boundaries (the .npy header shifts the data).
+    '''
+    try:
+        # check
+        if not os.path.exists(src):
+            raise ValueError('File not found')
+
+        # in place
+        in_place = os.path.exists(dst) and os.path.samefile(src, dst)
+
+        # source
+        source = _open_source(src, dtype, in_place)
+
+        # output dtype
+        out_dtype = source.dtype if out_dtype is None else np.dtype(out_dtype)
+        if in_place and out_dtype != source.dtype:
+            raise ValueError(
+                'In-place conversion requires the same source and destination dtype')
+        if not np.issubdtype(out_dtype, np.floating):
+            raise TypeError(f'Output dtype must be floating, got {out_dtype}')
+
+        # memory order (1-d arrays are both C and F contiguous)
+        fortran_order = source.flags.f_contiguous and not source.flags.c_contiguous
+
+        # destination
+        destination = source if in_place else _open_destination(
+            dst, out_dtype, source.shape, fortran_order)
+
+        # flat views in the same memory order (no copy)
+        order = 'F' if fortran_order else 'C'
+        src_flat = source.reshape(-1, order=order)
+        dst_flat = destination.reshape(-1, order=order)
+
+        # chunk size rounded to a multiple of the page size
+        chunk_bytes = CHUNK_BYTES if chunk_size is None else int(chunk_size)
+        chunk_bytes = max(mmap.PAGESIZE,
+                          chunk_bytes - chunk_bytes % mmap.PAGESIZE)
+        itemsize = max(source.dtype.itemsize, out_dtype.itemsize)
+        step = max(1, chunk_bytes // itemsize)
+
+        # convert
+        n = src_flat.size
+        for i in range(0, n, step):
+            if kernel is not None:
+                kernel(src_flat[i:i + step], dst_flat[i:i + step])
+            else:
+                convert_array(src_flat[i:i + step], scale, offset,
+                              out=dst_flat[i:i + step])
+
+        # flush
+        if isinstance(destination, np.memmap):
+            destination.flush()
+
+        # release maps
+        del src_flat, dst_flat, source, destination
+
+        return n
+    except Exception as e:
+        raise Exception('File conversion failed!, ', e)
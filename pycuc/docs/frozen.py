@@ -0,0 +1,121 @@
+# FROZEN REGISTRY
+# ================
+
+# import packages/modules
+import gc
+import sys
+from array import array
+from types import MappingProxyType
+from collections.abc import Mapping
+
+
+class FrozenGroup(Mapping):
+    '''
+    An immutable unit group: interned symbols and a contiguous float64 buffer
+
+    Parameters
+    ----------
+    units : dict
+        unit -> factor
+    '''
+
+    __slots__ = ('_index', '_factors')
+
+    def __init__(self, units):
+        # interned symbols -> position
+        self._index = {sys.intern(str(unit)): i for i,
+                       unit in enumerate(units)}
+        # contiguous, read-only factors
+        self._factors = memoryview(
+            array('d', (float(v) for v in units.values()))).toreadonly()
+
+    def __getitem__(self, unit):
+        return self._factors[self._index[unit]]
+
+    def __contains__(self, unit):
+        return unit in self._index
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self):
+        return len(self._index)
+
+    def __repr__(self):
+        return f'FrozenGroup({dict(self)!r})'
+
+    def __reduce__(self):
+        return (FrozenGroup, (dict(self),))
+
+    @property
+    def factors(self):
+        '''
+        Factors as a read-only numpy array (no copy)
+        '''
+        import numpy as np
+        return np.frombuffer(self._factors, dtype=np.float64)
+
+
+def freeze(converter, gc_freeze=True):
+    '''
+    Freezes the unit registry before forking worker processes
+
+    Parameters
+    ----------
+    converter : CustomUnitConverterX
+        converter with all units loaded (such as `pycuc.go(reference_file=...)`)
+    gc_freeze : bool
+        move all objects to the permanent gc generation (`gc.freeze()`)
+
+    Returns
+    -------
+    CustomUnitConverterX
+        converter
+
+    Notes
+    ------
+    1. Unit groups become `FrozenGroup` objects (interned symbols, contiguous factors) inside read-only mappings.
+    2. Adding, loading and reloading units or families raises afterwards.
+    3. With `gc.freeze()` the garbage collector no longer touches the pages shared with forked workers.
+    '''
+    try:
+        cls = type(converter)
+
+        # custom groups
+        groups = {sys.intern(str(group)): FrozenGroup(units)
+                  for group, units in cls._custom_conversions_full.items()}
+        if 'CUSTOM' not in groups:
+            groups['CUSTOM'] = FrozenGroup({})
+
+        cls._custom_conversions_full = MappingProxyType(groups)
+        cls._custom_conversions = groups['CUSTOM']
+
+        # built-in references
+        pressure = FrozenGroup(converter.pressure_conversions_ref)
+        temperature = FrozenGroup(converter.temperature_conversions_ref)
+        cls._pressure_conversions_ref = pressure
+        cls._temperature_conversions_ref = temperature
+        converter._pressure_conversions = pressure
+        converter._temperature_conversions = temperature
+
+        # flag
+        cls._frozen = True
+        if hasattr(cls, '_reset_caches'):
+            cls._reset_caches()
+
+        # gc
+        if gc_freeze and hasattr(gc, 'freeze'):
+            gc.collect()
+            gc.freeze()
+
+        return converter
+    except Exception as e:
+        raise Exception('Freezing registry failed!, ', e)
+
+
+def check_not_frozen(converter):
+    '''
+    Raises if the registry of the converter is frozen
+    '''
+    if getattr(converter, '_frozen', False):
+        raise RuntimeError('Registry is frozen (pycuc.freeze)')
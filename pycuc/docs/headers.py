@@ -0,0 +1,151 @@
+# UNIT-ANNOTATED HEADERS
+# =======================
+
+# import packages/modules
+import re
+import numpy as np
+# local
+from .arrayx import convert_array
+
+# common spellings -> unit symbols
+UNIT_ALIASES = {
+    'degc': 'C', 'deg c': 'C', '°c': 'C', 'celsius': 'C',
+    'degf': 'F', 'deg f': 'F', '°f': 'F', 'fahrenheit': 'F',
+    'degr': 'R', 'deg r': 'R', '°r': 'R', 'rankine': 'R',
+    'degk': 'K', 'kelvin': 'K',
+    'psia': 'psi', 'lbf/in2': 'psi',
+}
+
+# `Name [unit]`, `Name (unit)`, `Name {unit}`
+_BRACKETS = re.compile(r'^(?P<name>.*?)\s*[\[\(\{]\s*(?P<unit>[^\]\)\}]+?)\s*[\]\)\}]\s*$')
+# `Name in unit`, `Name, unit`
+_SEPARATORS = re.compile(r'^(?P<name>.+?)(?:\s+in\s+|\s*,\s*)(?P<unit>\S+)\s*$')
+
+
+def normalize_unit(unit, known):
+    '''
+    Returns the unit symbol of an annotation or None
+
+    Parameters
+    ----------
+    unit : str
+        annotation such as `psi`, `degF`, `°C`
+    known : callable
+        `known(unit) -> bool`
+
+    Returns
+    -------
+    str | None
+        unit symbol
+    '''
+    unit = unit.strip()
+    if known(unit):
+        return unit
+    alias = UNIT_ALIASES.get(unit.lower())
+    if alias is not None and known(alias):
+        return alias
+    return None
+
+
+def parse_header(header, known):
+    '''
+    Extracts the name and unit of a column header
+
+    Parameters
+    ----------
+    header : str
+        header such as `Pressure [psi]`, `T (degF)`, `Cp_kJ/kmol.K`
+    known : callable
+        `known(unit) -> bool`, resolves against the loaded references
+
+    Returns
+    -------
+    tuple
+        (name, unit), unit is None if the header has no known unit
+    '''
+    # set
+    header = str(header).strip()
+
+    # brackets and separators
+    for pattern in (_BRACKETS, _SEPARATORS):
+        match = pattern.match(header)
+        if match:
+            unit = normalize_unit(match.group('unit'), known)
+            if unit is not None:
+                return match.group('name').strip(), unit
+
+    # suffix after an underscore (longest known suffix first)
+    parts = header.split('_')
+    for i in range(1, len(parts)):
+        unit = normalize_unit('_'.join(parts[i:]), known)
+        if unit is not None:
+            return '_'.join(parts[:i]), unit
+
+    return header, None
+
+
+class HeaderPlan:
+    '''
+    A column -> target unit conversion plan built from unit-annotated headers
+
+    Parameters
+    ----------
+    columns : list
+        `(column, name, from_unit, to_unit, scale, offset, family)` per converted column
+    headers : tuple
+        all headers of the layout
+    '''
+
+    def __init__(self, columns, headers):
+        self.columns = list(columns)
+        self.headers = tuple(headers)
+
+    def __repr__(self):
+        items = ', '.join(f'{c[0]!r}: {c[2]} => {c[3]}' for c in self.columns)
+        return f'<pycuc HeaderPlan {{{items}}}>'
+
+    def __len__(self):
+        return len(self.columns)
+
+    def renames(self):
+        '''
+        Returns the new headers of the converted columns (`Name [to_unit]`)
+        '''
+        return {column: f'{name} [{to_unit}]' for column, name, _, to_unit, _, _, _
+                in self.columns}
+
+    def apply(self, data, rename=False):
+        '''
+        Converts the planned columns (vectorized)
+
+        Parameters
+        ----------
+        data : pandas.DataFrame | dict
+            table with the planned headers, or column -> array
+        rename : bool
+            rename converted columns to `Name [to_unit]`
+
+        Returns
+        -------
+        pandas.DataFrame | dict
+            converted table (a new object, inputs are not changed)
+        '''
+        try:
+            # dict of columns
+            if isinstance(data, dict):
+                res = dict(data)
+                for column, _, from_unit, to_unit, scale, offset, family in self.columns:
+                    values = np.asarray(res[column], dtype=np.float64)
+                    res[column] = family.convert_array(values, from_unit, to_unit) if family \
+                        is not None else convert_array(values, scale, offset)
+                return {self.renames().get(k, k): v for k, v in res.items()} if rename else res
+
+            # dataframe (shallow copy, converted columns are replaced)
+            res = data.copy(deep=False)
+            for column, _, from_unit, to_unit, scale, offset, family in self.columns:
+                values = res[column].to_numpy(dtype=np.float64, na_value=np.nan)
+                res[column] = family.convert_array(values, from_unit, to_unit) if family \
+                    is not None else convert_array(values, scale, offset)
+            return res.rename(columns=self.renames()) if rename else res
+        except Exception as e:
+            raise Exception('Applying header plan failed!, ', e)
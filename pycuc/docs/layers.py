@@ -0,0 +1,272 @@
+# LAYERED REFERENCE FILES
+# ========================
+
+# import packages/modules
+import os
+import json
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+# local
+from .loaders import load_reference, UnitMap, ROOT_KEY, BOUNDS_KEY
+
+# directive keys (case-insensitive)
+INCLUDE_KEY = 'include'
+REPLACE_KEY = 'replace'
+
+# merged layers: key -> (file hashes, groups)
+_layer_cache = {}
+
+
+def file_hash(f):
+    '''
+    Returns the sha1 of a file content
+    '''
+    with open(f, 'rb') as file:
+        return hashlib.sha1(file.read()).hexdigest()
+
+
+def _directive(data, key):
+    '''
+    Returns a top-level directive as a list (include/replace)
+    '''
+    for k, v in data.items():
+        if str(k).strip().lower() == key:
+            if v is None:
+                return []
+            return [v] if isinstance(v, str) else list(v)
+    return []
+
+
+def _parse(f):
+    '''
+    Parses one layer
+
+    Returns
+    -------
+    tuple
+        (groups, includes as absolute paths, groups to replace, bounds)
+    '''
+    data = load_reference(f)
+    if not data:
+        return {}, [], [], {}
+
+    # includes are relative to the including file
+    folder = os.path.dirname(os.path.abspath(f))
+    includes = [os.path.normpath(os.path.join(folder, str(i)))
+                for i in _directive(data, INCLUDE_KEY)]
+
+    # groups
+    groups = {str(group).strip(): units for group,
+              units in (data.get(ROOT_KEY) or {}).items()}
+
+    # bounds
+    bounds = {str(group).strip(): value for group,
+              value in (data.get(BOUNDS_KEY) or {}).items()}
+
+    return groups, includes, [str(g).strip() for g in _directive(data, REPLACE_KEY)], bounds
+
+
+def _resolve(files, max_workers=None):
+    '''
+    Parses files and their includes
+
+    Returns
+    -------
+    tuple
+        (ordered layer paths, parsed layers by path)
+
+    Notes
+    ------
+    1. Parsing is CPU-bound (the GIL serializes threads), files of one include level are parsed in `max_workers` processes if `max_workers > 1`, otherwise in this process.
+    '''
+    # parsed layers
+    parsed = {}
+
+    # worker processes (created on the first level with several files)
+    executor = None
+
+    # parse level by level (files of one level are independent)
+    pending = [os.path.abspath(f) for f in files]
+    try:
+        while pending:
+            todo = list(dict.fromkeys(f for f in pending if f not in parsed))
+            for f in todo:
+                if not os.path.exists(f):
+                    raise ValueError(f'File not found: {f}')
+            if max_workers and max_workers > 1 and len(todo) > 1:
+                if executor is None:
+                    executor = ProcessPoolExecutor(max_workers=max_workers)
+                results = executor.map(_parse, todo)
+            else:
+                results = map(_parse, todo)
+            for f, res in zip(todo, results):
+                parsed[f] = res
+            pending = [i for f in todo for i in parsed[f][1]]
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    # order: includes first (depth-first), then the file, each file once
+    order = []
+    visiting = set()
+
+    def visit(f):
+        if f in order:
+            return
+        if f in visiting:
+            raise ValueError(f'Circular include: {f}')
+        visiting.add(f)
+        for i in parsed[f][1]:
+            visit(i)
+        visiting.discard(f)
+        order.append(f)
+
+    for f in files:
+        visit(os.path.abspath(f))
+
+    return order, parsed
+
+
+def merge_layers(layers):
+    '''
+    Merges parsed layers, later layers win
+
+    Parameters
+    ----------
+    layers : list
+        `(groups, replace)` per layer in order
+
+    Returns
+    -------
+    dict
+        merged groups (group -> {unit: factor})
+    '''
+    # merged
+    merged = {}
+
+    for groups, replace in layers:
+        for group, units in groups.items():
+            # replace the group or merge units
+            if group in replace or group not in merged:
+                merged[group] = UnitMap(units or {})
+            else:
+                merged[group].update(units or {})
+            # duplicates within a file are kept for validation
+            merged[group].duplicates.extend(getattr(units, 'duplicates', ()))
+
+    return merged
+
+
+def load_layers(files, max_workers=None, cache_dir=None):
+    '''
+    Loads layered reference files with include directives
+
+    Parameters
+    ----------
+    files : str | list
+        reference files from base to most specific layer
+    max_workers : int, optional
+        parser processes (default: parse in this process)
+    cache_dir : str, optional
+        folder to keep merged results between runs
+
+    Returns
+    -------
+    tuple
+        (merged groups, ordered layer paths, merged bounds, owner layer of each group)
+
+    Notes
+    ------
+    1. A layer can contain `include: [other.yml, ...]` (paths relative to the layer), included files are loaded before the layer.
+    2. Units of a group are merged across layers, later layers win, `replace: [GROUP, ...]` replaces a group instead.
+    3. `BOUNDS` of a group are taken from the last layer defining them.
+    4. The owner of a group is the last layer defining it.
+    5. The merged result is cached per set of file hashes (in memory and optionally as json in `cache_dir`).
+    '''
+    try:
+        # set
+        if isinstance(files, (str, os.PathLike)):
+            files = [files]
+        files = [os.path.abspath(f) for f in files]
+        key = tuple(files)
+
+        # cache: valid if no layer changed
+        cached = _layer_cache.get(key)
+        if cached is None and cache_dir:
+            cached = _read_disk_cache(cache_dir, key)
+        if cached is not None and len(cached) == 4:
+            hashes, groups, bounds, owners = cached
+            if all(os.path.exists(f) and file_hash(f) == h for f, h in hashes):
+                _layer_cache[key] = cached
+                return (_copy_groups(groups), [f for f, _ in hashes], dict(bounds),
+                        dict(owners))
+
+        # parse
+        order, parsed = _resolve(files, max_workers)
+
+        # merge
+        groups = merge_layers([(parsed[f][0], parsed[f][2]) for f in order])
+        bounds = {}
+        owners = {}
+        for f in order:
+            bounds.update(parsed[f][3])
+            owners.update((group, f) for group in parsed[f][0])
+
+        # save
+        cached = ([(f, file_hash(f)) for f in order], groups, bounds, owners)
+        _layer_cache[key] = cached
+        if cache_dir:
+            _write_disk_cache(cache_dir, key, cached)
+
+        return _copy_groups(groups), order, dict(bounds), dict(owners)
+    except Exception as e:
+        raise Exception('Loading layered reference files failed!, ', e)
+
+
+def _copy_groups(groups):
+    '''
+    Copies groups so callers cannot change the cache
+    '''
+    return {group: units.copy() for group, units in groups.items()}
+
+
+def _disk_cache_path(cache_dir, key):
+    name = hashlib.sha1('\n'.join(key).encode('utf-8')).hexdigest()
+    return os.path.join(cache_dir, f'pycuc-layers-{name}.json')
+
+
+def _read_disk_cache(cache_dir, key):
+    # json (plain data only, a shared cache folder cannot run code)
+    try:
+        with open(_disk_cache_path(cache_dir, key), 'r', encoding='utf-8') as file:
+            data = json.load(file)
+        groups = {}
+        for group, units in data['groups'].items():
+            groups[group] = UnitMap(units['units'])
+            groups[group].duplicates = [tuple(pair) for pair in units['duplicates']]
+        return ([tuple(pair) for pair in data['hashes']], groups,
+                dict(data['bounds']), dict(data['owners']))
+    except Exception:
+        return None
+
+
+def _write_disk_cache(cache_dir, key, cached):
+    # set
+    hashes, groups, bounds, owners = cached
+    data = {
+        'hashes': hashes,
+        # units as pairs (keys keep their types, duplicates are kept)
+        'groups': {group: {'units': list(units.items()),
+                           'duplicates': list(getattr(units, 'duplicates', ()))}
+                   for group, units in groups.items()},
+        'bounds': bounds,
+        'owners': owners,
+    }
+
+    # write then rename (atomic)
+    os.makedirs(cache_dir, exist_ok=True)
+    path = _disk_cache_path(cache_dir, key)
+    tmp = f'{path}.{os.getpid()}.tmp'
+    with open(tmp, 'w', encoding='utf-8') as file:
+        json.dump(data, file, default=str)
+    os.replace(tmp, path)
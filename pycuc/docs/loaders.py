@@ -0,0 +1,299 @@
+# REFERENCE FILE LOADERS
+# =======================
+
+# import packages/modules
+import os
+import csv
+import json
+import yaml
+
+# C-accelerated yaml loader if libyaml is available
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader as _YamlLoader
+
+# toml (stdlib from python 3.11)
+try:
+    import tomllib as _toml
+except ImportError:  # pragma: no cover
+    try:
+        import tomli as _toml
+    except ImportError:
+        _toml = None
+
+# root key
+ROOT_KEY = 'CUSTOM-UNIT'
+# physical bounds of groups: GROUP: {unit: ..., min: ..., max: ...}
+BOUNDS_KEY = 'BOUNDS'
+
+
+class UnitMap(dict):
+    '''
+    A mapping read from a reference file that keeps its duplicate keys
+
+    The first value of a key is kept, later `(key, value)` pairs are listed
+    in `duplicates` so that validation can report them.
+    '''
+
+    def __init__(self, pairs=()):
+        super().__init__()
+        self.duplicates = []
+        for key, value in (pairs.items() if isinstance(pairs, dict) else pairs):
+            self.add(key, value)
+
+    def add(self, key, value):
+        '''
+        Adds a key, a key already present is recorded as duplicate
+        '''
+        if key in self:
+            self.duplicates.append((key, value))
+        else:
+            self[key] = value
+
+    def copy(self):
+        res = UnitMap(self)
+        res.duplicates = list(self.duplicates)
+        return res
+
+
+class _UnitMapLoader(_YamlLoader):
+    '''
+    yaml loader building `UnitMap` mappings (duplicate keys are kept)
+    '''
+
+
+def _construct_unit_map(loader, node):
+    loader.flatten_mapping(node)
+    return UnitMap((loader.construct_object(key, deep=True),
+                    loader.construct_object(value, deep=True))
+                   for key, value in node.value)
+
+
+_UnitMapLoader.add_constructor(
+    yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, _construct_unit_map)
+
+
+def load_yaml(f):
+    '''
+    Loads a yml reference file
+    '''
+    with open(f, 'r', encoding='utf-8') as file:
+        return yaml.load(file, Loader=_UnitMapLoader)
+
+
+def load_json(f):
+    '''
+    Loads a json reference file
+    '''
+    with open(f, 'r', encoding='utf-8') as file:
+        return json.load(file, object_pairs_hook=UnitMap)
+
+
+def load_toml(f):
+    '''
+    Loads a toml reference file
+    '''
+    # check
+    if _toml is None:
+        raise ValueError('Reading toml files requires python 3.11+ or tomli')
+
+    with open(f, 'rb') as file:
+        return _toml.load(file)
+
+
+def load_csv(f):
+    '''
+    Loads a flat csv reference file with `group,unit,factor` rows
+
+    Notes
+    ------
+    1. A header row `group,unit,factor` is optional.
+    2. Empty lines and lines starting with `#` are ignored.
+    3. Factors are kept as read, they are checked with the other reference formats when loaded.
+    '''
+    # groups
+    groups = {}
+
+    with open(f, 'r', encoding='utf-8', newline='') as file:
+        for i, row in enumerate(csv.reader(file), start=1):
+            # skip
+            if not row or row[0].strip().startswith('#'):
+                continue
+
+            # check
+            if len(row) != 3:
+                raise ValueError(
+                    f'Line {i}: expected group,unit,factor but got {len(row)} fields')
+
+            group, unit, factor = (item.strip() for item in row)
+
+            # header
+            if i == 1 and (group.lower(), unit.lower(), factor.lower()) == ('group', 'unit', 'factor'):
+                continue
+
+            groups.setdefault(group, UnitMap()).add(unit, factor)
+
+    return {ROOT_KEY: groups}
+
+
+# extension -> loader
+LOADERS = {
+    '.yml': load_yaml,
+    '.yaml': load_yaml,
+    '.json': load_json,
+    '.toml': load_toml,
+    '.csv': load_csv,
+}
+
+
+def register_loader(extension, loader):
+    '''
+    Registers a reference file loader
+
+    Parameters
+    ----------
+    extension : str
+        file extension such as `.ini`
+    loader : callable
+        `loader(path) -> dict` returning the `CUSTOM-UNIT` structure
+    '''
+    # set
+    extension = str(extension).strip().lower()
+    if not extension.startswith('.'):
+        extension = '.' + extension
+
+    LOADERS[extension] = loader
+
+
+def sniff_format(f):
+    '''
+    Guesses the loader of a file from its content
+
+    Parameters
+    ----------
+    f : str
+        file path
+
+    Returns
+    -------
+    str
+        extension of the matching loader
+    '''
+    with open(f, 'r', encoding='utf-8') as file:
+        head = file.read(4096)
+
+    # first meaningful line
+    lines = [line.strip() for line in head.splitlines()
+             if line.strip() and not line.strip().startswith('#')]
+    first = lines[0] if lines else ''
+
+    # check
+    if first.startswith('{'):
+        return '.json'
+    if first.startswith('['):
+        return '.toml'
+    if ':' not in first and first.count(',') == 2:
+        return '.csv'
+    if ':' not in first and '=' in first:
+        return '.toml'
+    return '.yml'
+
+
+def validate_reference(data):
+    '''
+    Checks the `CUSTOM-UNIT` structure
+
+    Parameters
+    ----------
+    data : dict
+        loaded reference data
+
+    Returns
+    -------
+    dict
+        data
+    '''
+    # empty
+    if not data:
+        return {}
+
+    # check
+    if not isinstance(data, dict):
+        raise ValueError('Reference file must contain a mapping')
+    if ROOT_KEY not in data:
+        # a layer may only include other files
+        if any(str(k).strip().lower() == 'include' for k in data):
+            return data
+        raise ValueError(f"Key '{ROOT_KEY}' not found")
+
+    groups = data[ROOT_KEY]
+    if not isinstance(groups, dict):
+        raise ValueError(f"'{ROOT_KEY}' must map group names to units")
+
+    for group, units in groups.items():
+        if not isinstance(units, dict):
+            raise ValueError(f"Group '{group}' must map units to factors")
+
+    # bounds
+    for group, bounds in (data.get(BOUNDS_KEY) or {}).items():
+        parse_bounds(group, bounds)
+
+    return data
+
+
+def parse_bounds(group, bounds):
+    '''
+    Checks the bounds of a group
+
+    Parameters
+    ----------
+    group : str
+        group name
+    bounds : dict
+        `{unit: ..., min: ..., max: ...}` (min/max optional)
+
+    Returns
+    -------
+    tuple
+        (unit, lower, upper), None for a missing bound
+    '''
+    # check
+    if not isinstance(bounds, dict) or 'unit' not in bounds:
+        raise ValueError(
+            f"Bounds of '{group}' must be a mapping with a 'unit' and 'min'/'max'")
+
+    lower = bounds.get('min')
+    upper = bounds.get('max')
+    lower = None if lower is None else float(lower)
+    upper = None if upper is None else float(upper)
+    if lower is not None and upper is not None and lower > upper:
+        raise ValueError(f"Bounds of '{group}': min is greater than max")
+
+    return str(bounds['unit']).strip(), lower, upper
+
+
+def load_reference(f):
+    '''
+    Loads a reference file with the loader selected by extension or content
+
+    Parameters
+    ----------
+    f : str
+        file path (.yml, .yaml, .json, .toml, .csv or any registered extension)
+
+    Returns
+    -------
+    dict
+        custom conversion unit
+    '''
+    # check file path
+    if not os.path.exists(f):
+        raise ValueError("File not found")
+
+    # loader
+    extension = os.path.splitext(str(f))[1].lower()
+    if extension not in LOADERS:
+        extension = sniff_format(f)
+
+    return validate_reference(LOADERS[extension](f))
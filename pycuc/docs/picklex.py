@@ -0,0 +1,145 @@
+# CONVERTER PICKLING
+# ===================
+
+# import packages/modules
+import os
+import json
+import hashlib
+import tempfile
+
+# fingerprint -> registry state, per process
+_registries = {}
+# fingerprints published by this process
+_published = set()
+
+
+def registry_state(cls):
+    '''
+    Returns the custom groups and bounds of a converter class as plain data
+
+    Parameters
+    ----------
+    cls : type
+        converter class
+
+    Returns
+    -------
+    dict
+        groups: group -> {unit: factor}, bounds: reference -> [unit, lower, upper]
+    '''
+    return {
+        'groups': {str(group): {str(unit): float(units[unit]) for unit in units}
+                   for group, units in cls._custom_conversions_full.items()},
+        'bounds': {str(reference): list(bounds)
+                   for reference, bounds in cls._bounds.items()},
+    }
+
+
+def fingerprint(state):
+    '''
+    Returns the fingerprint of a registry state
+
+    Parameters
+    ----------
+    state : dict
+        registry state (see `registry_state`)
+
+    Returns
+    -------
+    tuple
+        (fingerprint, serialized state)
+    '''
+    # canonical json
+    data = json.dumps(state, sort_keys=True, separators=(',', ':')).encode('utf-8')
+    return _digest(data), data
+
+
+def _digest(data):
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def registry_dir():
+    '''
+    Returns the folder of the published registries (`PYCUC_REGISTRY_DIR` or the temporary folder)
+    '''
+    return os.environ.get('PYCUC_REGISTRY_DIR') or tempfile.gettempdir()
+
+
+def _registry_path(key):
+    return os.path.join(registry_dir(), f'pycuc-registry-{key}.json')
+
+
+def publish_registry(key, data):
+    '''
+    Writes a serialized registry once to the registry folder (named by its fingerprint)
+
+    Parameters
+    ----------
+    key : str
+        registry fingerprint
+    data : bytes
+        serialized state
+    '''
+    # once per process
+    if key in _published:
+        return
+
+    # check: an existing file must hold the same registry
+    path = _registry_path(key)
+    try:
+        with open(path, 'rb') as f:
+            current = f.read()
+    except OSError:
+        current = None
+
+    # write (atomic)
+    if current != data:
+        tmp = f'{path}.{os.getpid()}.tmp'
+        with open(tmp, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, path)
+
+    _published.add(key)
+
+
+def load_registry(key):
+    '''
+    Returns the registry of a fingerprint, reading its file once per process
+
+    Parameters
+    ----------
+    key : str
+        registry fingerprint
+
+    Returns
+    -------
+    dict
+        groups: group -> {unit: factor}, bounds: reference -> (unit, lower, upper)
+    '''
+    # cached
+    state = _registries.get(key)
+    if state is not None:
+        return state
+
+    # read
+    path = _registry_path(key)
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+    except OSError:
+        raise FileNotFoundError(
+            f"Registry '{key}' not found in '{registry_dir()}' (set PYCUC_REGISTRY_DIR to a shared folder)")
+
+    # check: the content must match its fingerprint
+    if _digest(data) != key:
+        raise ValueError(f"Registry file '{path}' does not match its fingerprint")
+
+    # load
+    state = json.loads(data.decode('utf-8'))
+    state = {
+        'groups': {group: dict(units) for group, units in state['groups'].items()},
+        'bounds': {reference: tuple(bounds) for reference, bounds in state['bounds'].items()},
+    }
+
+    _registries[key] = state
+    return state
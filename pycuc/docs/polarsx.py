@@ -0,0 +1,91 @@
+# POLARS NAMESPACE
+# =================
+
+# import packages/modules
+# local
+from .cucx import shared_converter
+
+
+def register_polars(converter=None, name='cuc'):
+    '''
+    Registers a unit conversion namespace on polars expressions and series
+
+    Parameters
+    ----------
+    converter : CustomUnitConverterX, optional
+        converter (default: shared converter)
+    name : str
+        namespace name (default: cuc)
+
+    Returns
+    -------
+    type
+        namespace class
+
+    Notes
+    ------
+    1. Blocks are resolved to `scale` and `offset` when the expression is built, the conversion is native polars arithmetic (lazy, optimized and multi-threaded).
+    2. Plugin families (nonlinear kernels) run through `map_batches` with their vectorized kernel.
+    3. Polars is optional, it is only imported here.
+
+    Examples
+    --------
+    >>> pycuc.register_polars(pycuc.go(reference_file=...))
+    >>> lf.with_columns(pl.col('P').cuc.to('psi => kPa'))
+    >>> df['T'].cuc.from_to('F', 'C')
+    '''
+    try:
+        import polars as pl
+
+        # converter
+        converter = shared_converter() if converter is None else converter
+
+        class UnitNamespace:
+            '''
+            Unit conversions of a polars expression or series
+            '''
+
+            def __init__(self, obj):
+                self._obj = obj
+
+            def to(self, unit_conversion_block, reference=None):
+                '''
+                Converts through a unit conversion block such as `psi => kPa`
+                '''
+                # interpret the unit conversion block
+                from_unit, _, to_unit = converter.check_conversion_block(
+                    unit_conversion_block)
+                return self.from_to(from_unit, to_unit, reference)
+
+            def from_to(self, from_unit, to_unit, reference=None):
+                '''
+                Converts from one unit to another
+                '''
+                # plugin families
+                family = converter._plugin_family(
+                    from_unit, to_unit, reference) if converter._families else None
+                if family is not None:
+                    def kernel(s):
+                        return pl.Series(s.name, family.convert_array(
+                            s.cast(pl.Float64).to_numpy(), from_unit, to_unit))
+                    if isinstance(self._obj, pl.Series):
+                        return kernel(self._obj)
+                    return self._obj.map_batches(kernel, return_dtype=pl.Float64)
+
+                # factors (resolved once)
+                scale, offset = converter.conversion_factors(
+                    from_unit, to_unit, reference)
+
+                # native arithmetic
+                res = self._obj * scale
+                if offset != 0:
+                    res = res + offset
+                return res
+
+        # register
+        pl.api.register_expr_namespace(name)(UnitNamespace)
+        pl.api.register_series_namespace(name)(UnitNamespace)
+
+        return UnitNamespace
+    except Exception as e:
+        raise Exception('Registering polars namespace failed!, ', e)
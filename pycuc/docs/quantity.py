@@ -0,0 +1,189 @@
+# QUANTITY
+# =========
+
+# import packages/modules
+import operator
+# local
+from .cucx import shared_converter
+
+
+class Quantity:
+    '''
+    A lightweight value with a unit
+
+    Only the value, the unit symbol and a pointer to a shared converter
+    (registry) are stored, conversion factors are resolved on demand and
+    cached by the registry.
+    '''
+
+    __slots__ = ('value', 'unit', '_registry')
+
+    def __init__(self, value, unit, registry=None):
+        self.value = value
+        self.unit = str(unit).strip()
+        self._registry = shared_converter() if registry is None else registry
+
+    def __repr__(self):
+        return f'Quantity({self.value!r}, {self.unit!r})'
+
+    def __str__(self):
+        return f'{self.value} {self.unit}'
+
+    def __float__(self):
+        return float(self.value)
+
+    @property
+    def registry(self):
+        return self._registry
+
+    def convert(self, to_unit, reference=None):
+        '''
+        Converts the value to another unit
+
+        Parameters
+        ----------
+        to_unit : str
+            to unit
+        reference : str
+            reference name such as pressure, temperature, custom
+
+        Returns
+        -------
+        float
+            converted value
+        '''
+        try:
+            return self._registry.convert(self.value, self.unit, str(to_unit).strip(), reference)
+        except Exception as e:
+            raise Exception('Setting conversion function failed!, ', e)
+
+    def to(self, to_unit, reference=None):
+        '''
+        Returns a new quantity in another unit
+
+        Parameters
+        ----------
+        to_unit : str
+            to unit
+        reference : str
+            reference name such as pressure, temperature, custom
+
+        Returns
+        -------
+        Quantity
+            converted quantity
+        '''
+        # set
+        to_unit = str(to_unit).strip()
+
+        # same unit
+        if to_unit == self.unit:
+            return Quantity(self.value, self.unit, self._registry)
+
+        return Quantity(self.convert(to_unit, reference), to_unit, self._registry)
+
+    def add_custom_unit(self, unit, conversion_factor):
+        '''
+        Adds a custom unit conversion to the shared registry
+
+        Parameters
+        ----------
+        unit : str
+            unit
+        conversion_factor : float
+            conversion factor
+
+        Returns
+        -------
+        bool
+            True if successful
+        '''
+        return self._registry.add_custom_unit(unit, conversion_factor)
+
+    def check_reference(self, reference, dataframe=True):
+        '''
+        Shows reference unit table of the shared registry
+
+        Parameters
+        ----------
+        reference : str
+            reference name such as pressure, temperature, custom
+
+        Returns
+        -------
+        reference : MappingProxyType | dataframe
+            reference details (read-only)
+        '''
+        # custom: the group of units added by add_custom_unit
+        if str(reference).strip().upper() == 'CUSTOM':
+            reference = 'CUSTOM::CUSTOM'
+        return self._registry.check_reference(reference, dataframe)
+
+    # arithmetic
+    def _value_in_my_unit(self, other):
+        '''
+        Returns the value of other in the unit of self (resolved lazily)
+        '''
+        # same unit: no conversion
+        if other.unit == self.unit:
+            return other.value
+        return self._registry.convert(other.value, other.unit, self.unit)
+
+    def _add_sub(self, other, op):
+        if isinstance(other, Quantity):
+            return Quantity(op(self.value, self._value_in_my_unit(other)), self.unit, self._registry)
+        return NotImplemented
+
+    def __add__(self, other):
+        return self._add_sub(other, operator.add)
+
+    def __sub__(self, other):
+        return self._add_sub(other, operator.sub)
+
+    def __mul__(self, other):
+        if isinstance(other, Quantity):
+            return NotImplemented
+        return Quantity(self.value * other, self.unit, self._registry)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        # ratio of two quantities (dimensionless)
+        if isinstance(other, Quantity):
+            return self.value / self._value_in_my_unit(other)
+        return Quantity(self.value / other, self.unit, self._registry)
+
+    def __neg__(self):
+        return Quantity(-self.value, self.unit, self._registry)
+
+    def __pos__(self):
+        return Quantity(self.value, self.unit, self._registry)
+
+    def __abs__(self):
+        return Quantity(abs(self.value), self.unit, self._registry)
+
+    # comparison
+    def _compare(self, other, op):
+        if isinstance(other, Quantity):
+            return op(self.value, self._value_in_my_unit(other))
+        return NotImplemented
+
+    def __eq__(self, other):
+        return self._compare(other, operator.eq)
+
+    def __ne__(self, other):
+        return self._compare(other, operator.ne)
+
+    def __lt__(self, other):
+        return self._compare(other, operator.lt)
+
+    def __le__(self, other):
+        return self._compare(other, operator.le)
+
+    def __gt__(self, other):
+        return self._compare(other, operator.gt)
+
+    def __ge__(self, other):
+        return self._compare(other, operator.ge)
+
+    __hash__ = None
@@ -35,6 +35,12 @@ class Refs:
         'R': 491.67  # Rankine
     }
 
+    # physical bounds per reference: (unit, lower, upper), None = unbounded
+    _bounds_ref = {
+        'PRESSURE': ('Pa', 0.0, None),  # absolute pressure
+        'TEMPERATURE': ('K', 0.0, None)  # absolute zero
+    }
+
     def __init__(self):
         pass
 
@@ -45,3 +51,7 @@ class Refs:
     @property
     def temperature_conversions_ref(self):
         return self._temperature_conversions_ref
+
+    @property
+    def bounds_ref(self):
+        return self._bounds_ref
@@ -0,0 +1,177 @@
+# UNIT SEARCH INDEX
+# ==================
+
+# import packages/modules
+from difflib import SequenceMatcher
+
+
+def trigrams(text):
+    '''
+    Returns the trigrams of a unit symbol (case-insensitive, padded)
+    '''
+    text = f'  {str(text).lower()} '
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class UnitSearchIndex:
+    '''
+    Prefix trie and trigram index over unit symbols
+
+    Each symbol maps to the references it belongs to, such as `PRESSURE`,
+    `custom::ENERGY` or a built-in catalog family.
+    '''
+
+    # end of symbol marker in trie nodes
+    _END = ''
+
+    def __init__(self):
+        # symbol -> set of references
+        self._refs = {}
+        # prefix trie: char -> node, node[''] = symbol
+        self._trie = {}
+        # trigram -> set of symbols
+        self._grams = {}
+
+    def __contains__(self, unit):
+        return unit in self._refs
+
+    def __len__(self):
+        return len(self._refs)
+
+    def references(self, unit):
+        '''
+        Returns the references of a unit
+        '''
+        return sorted(self._refs.get(unit, ()))
+
+    def add(self, unit, reference):
+        '''
+        Adds a unit symbol under a reference
+        '''
+        # set
+        unit = str(unit)
+
+        # existing symbol
+        if unit in self._refs:
+            self._refs[unit].add(reference)
+            return
+
+        self._refs[unit] = {reference}
+
+        # trie
+        node = self._trie
+        for ch in unit:
+            node = node.setdefault(ch, {})
+        node[self._END] = unit
+
+        # trigrams
+        for gram in trigrams(unit):
+            self._grams.setdefault(gram, set()).add(unit)
+
+    def remove(self, unit, reference):
+        '''
+        Removes a unit symbol from a reference (and from the index if unused)
+        '''
+        # set
+        unit = str(unit)
+        refs = self._refs.get(unit)
+        if refs is None:
+            return
+
+        refs.discard(reference)
+        if refs:
+            return
+        del self._refs[unit]
+
+        # trie (prune empty nodes)
+        path = [self._trie]
+        for ch in unit:
+            path.append(path[-1][ch])
+        path[-1].pop(self._END, None)
+        for ch, node in zip(reversed(unit), reversed(path[:-1])):
+            if node[ch]:
+                break
+            del node[ch]
+
+        # trigrams
+        for gram in trigrams(unit):
+            symbols = self._grams.get(gram)
+            if symbols is not None:
+                symbols.discard(unit)
+                if not symbols:
+                    del self._grams[gram]
+
+    def prefix(self, query, limit=20):
+        '''
+        Returns symbols starting with query (shortest first)
+
+        Parameters
+        ----------
+        query : str
+            prefix such as `kJ/`
+        limit : int
+            max number of symbols
+
+        Returns
+        -------
+        list
+            symbols
+        '''
+        # walk
+        node = self._trie
+        for ch in str(query):
+            node = node.get(ch)
+            if node is None:
+                return []
+
+        # breadth-first: shorter symbols first
+        res = []
+        level = [node]
+        while level and len(res) < limit:
+            nxt = []
+            for n in level:
+                for ch in sorted(n):
+                    if ch == self._END:
+                        res.append(n[ch])
+                    else:
+                        nxt.append(n[ch])
+            level = nxt
+
+        return res[:limit]
+
+    def similar(self, query, limit=5, cutoff=0.5):
+        '''
+        Returns the nearest symbols to a (misspelled) query
+
+        Parameters
+        ----------
+        query : str
+            unit symbol
+        limit : int
+            max number of symbols
+        cutoff : float
+            minimum similarity (0..1)
+
+        Returns
+        -------
+        list
+            symbols, best match first
+        '''
+        # candidates sharing trigrams
+        grams = trigrams(query)
+        counts = {}
+        for gram in grams:
+            for symbol in self._grams.get(gram, ()):
+                counts[symbol] = counts.get(symbol, 0) + 1
+
+        # best candidates by shared trigrams, then exact ratio
+        candidates = sorted(counts, key=counts.get, reverse=True)[:50]
+        scored = []
+        for symbol in candidates:
+            ratio = SequenceMatcher(None, str(query).lower(),
+                                    symbol.lower()).ratio()
+            if ratio >= cutoff:
+                scored.append((ratio, symbol))
+
+        scored.sort(key=lambda x: (-x[0], len(x[1]), x[1]))
+        return [symbol for _, symbol in scored[:limit]]
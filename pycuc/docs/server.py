@@ -0,0 +1,264 @@
+# CONVERSION SERVER
+# ==================
+
+# import packages/modules
+import os
+import json
+import time
+import threading
+import socketserver
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import numpy as np
+
+
+class ConversionService:
+    '''
+    Batch conversion service around one preloaded CustomUnitConverterX
+
+    Parameters
+    ----------
+    converter : CustomUnitConverterX
+        preloaded converter (such as `pycuc.go(reference_file=...)`)
+    reference_file : str, optional
+        yml reference file, reloaded when its modification time changes
+    max_samples : int
+        number of request latencies kept for percentiles
+    '''
+
+    def __init__(self, converter, reference_file=None, max_samples=10000):
+        self.converter = converter
+        self.reference_file = reference_file
+        # reload
+        self._lock = threading.Lock()
+        self._mtime = os.path.getmtime(
+            reference_file) if reference_file else None
+        self.reloads = 0
+        self.reload_error = None
+        # stats
+        self._latencies = deque(maxlen=max_samples)
+        self.requests = 0
+        self.errors = 0
+
+    def reload_if_changed(self):
+        '''
+        Reloads the reference file if it has been modified
+
+        Returns
+        -------
+        bool
+            True if reloaded
+
+        Notes
+        ------
+        1. A failed reload (such as an invalid factor) keeps the last good units, the error is reported by `/stats` and the file is retried on its next change.
+        '''
+        # check
+        if not self.reference_file:
+            return False
+
+        try:
+            mtime = os.path.getmtime(self.reference_file)
+        except OSError:
+            # file being replaced, keep the current units
+            return False
+
+        if mtime == self._mtime:
+            return False
+
+        # one reload at a time, conversions do not wait (the converter swaps
+        # the new registry in at once)
+        with self._lock:
+            if mtime != self._mtime:
+                # this version is tried once
+                self._mtime = mtime
+                try:
+                    # apply only the differences
+                    self.converter.reload_custom_unit(self.reference_file)
+                except Exception as e:
+                    # keep serving the current units
+                    self.reload_error = str(e)
+                    return False
+                self.reload_error = None
+                self.reloads += 1
+        return True
+
+    def convert_batch(self, payload):
+        '''
+        Converts a batch request
+
+        Parameters
+        ----------
+        payload : dict
+            `{"block": "psi => kPa", "values": [...], "reference": null}` or
+            `{"items": [{"block": ..., "values": [...]}, ...]}`
+
+        Returns
+        -------
+        dict
+            `{"values": [...]}` or `{"results": [{"values": [...]}, ...]}`
+        '''
+        # multiple blocks
+        if 'items' in payload:
+            return {'results': [self.convert_batch(item) for item in payload['items']]}
+
+        # check
+        if 'block' not in payload or 'values' not in payload:
+            raise ValueError("Keys 'block' and 'values' are required")
+
+        # values (null -> nan)
+        values = np.array(payload['values'], dtype=np.float64)
+
+        # convert (vectorized, in place)
+        self.converter.to(values, payload['block'],
+                          payload.get('reference'), out=values)
+
+        # nan -> null
+        res = values.tolist()
+        if np.isnan(values).any():
+            res = [None if v != v else v for v in res]
+
+        return {'values': res}
+
+    def record(self, latency, failed=False):
+        '''
+        Records a request latency in seconds
+        '''
+        self._latencies.append(latency)
+        self.requests += 1
+        if failed:
+            self.errors += 1
+
+    def stats(self):
+        '''
+        Returns request statistics
+
+        Returns
+        -------
+        dict
+            request count, errors, reloads, last reload error and latency percentiles in ms
+        '''
+        # latencies
+        latencies = np.array(self._latencies, dtype=np.float64) * 1000
+        percentiles = {}
+        if latencies.size:
+            p50, p90, p99 = np.percentile(latencies, [50, 90, 99])
+            percentiles = {'p50': p50, 'p90': p90,
+                           'p99': p99, 'max': latencies.max()}
+
+        return {
+            'requests': self.requests,
+            'errors': self.errors,
+            'reloads': self.reloads,
+            'reload_error': self.reload_error,
+            'latency_ms': percentiles
+        }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    '''
+    HTTP handler: POST /convert, GET /stats, GET /health
+    '''
+
+    # set by make_server
+    service = None
+
+    def address_string(self):
+        # unix sockets have no host/port
+        if isinstance(self.client_address, tuple) and self.client_address:
+            return str(self.client_address[0])
+        return 'unix'
+
+    def log_message(self, format, *args):
+        # quiet, latencies are reported by /stats
+        pass
+
+    def _send(self, status, body):
+        data = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if self.path == '/stats':
+            self._send(200, self.service.stats())
+        elif self.path == '/health':
+            self._send(200, {'status': 'ok'})
+        else:
+            self._send(404, {'error': 'Not found'})
+
+    def do_POST(self):
+        if self.path != '/convert':
+            self._send(404, {'error': 'Not found'})
+            return
+
+        # start
+        start = time.perf_counter()
+        failed = False
+        try:
+            # hot reload
+            self.service.reload_if_changed()
+
+            # payload
+            length = int(self.headers.get('Content-Length', 0))
+            payload = json.loads(self.rfile.read(length) or b'{}')
+
+            # convert
+            status, body = 200, self.service.convert_batch(payload)
+        except Exception as e:
+            failed = True
+            status, body = 400, {'error': str(e)}
+
+        self._send(status, body)
+        self.service.record(time.perf_counter() - start, failed)
+
+
+class _UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    '''
+    HTTP server on a unix socket
+    '''
+    daemon_threads = True
+
+
+def make_server(converter, reference_file=None, host='127.0.0.1', port=8765, unix_socket=None):
+    '''
+    Creates the conversion server (not started)
+
+    Parameters
+    ----------
+    converter : CustomUnitConverterX
+        preloaded converter
+    reference_file : str, optional
+        yml reference file to hot-reload
+    host : str
+        host (default: localhost only)
+    port : int
+        port
+    unix_socket : str, optional
+        unix socket path, used instead of host/port
+
+    Returns
+    -------
+    socketserver.BaseServer
+        server, call `serve_forever()` to start
+    '''
+    try:
+        # handler bound to the service
+        service = ConversionService(converter, reference_file)
+        handler = type('Handler', (_Handler,), {'service': service})
+
+        # unix socket
+        if unix_socket:
+            if os.path.exists(unix_socket):
+                os.remove(unix_socket)
+            server = _UnixHTTPServer(unix_socket, handler)
+        else:
+            server = ThreadingHTTPServer((host, port), handler)
+            server.daemon_threads = True
+
+        server.service = service
+        return server
+    except Exception as e:
+        raise Exception('Creating server failed!, ', e)
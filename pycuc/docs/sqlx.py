@@ -0,0 +1,174 @@
+# DATABASE FUNCTIONS
+# ===================
+
+# import packages/modules
+# local
+from .cucx import shared_converter
+from . import arrowx
+from .arrowx import convert_arrow, load_pyarrow
+
+
+def register_sqlite(conn, converter=None, name='cuc_to', from_to_name='cuc_from_to'):
+    '''
+    Registers unit conversion functions on a sqlite3 connection
+
+    Parameters
+    ----------
+    conn : sqlite3.Connection
+        connection
+    converter : CustomUnitConverterX, optional
+        converter (default: shared converter)
+    name : str
+        function name (default: cuc_to)
+    from_to_name : str
+        from/to function name (default: cuc_from_to)
+
+    Returns
+    -------
+    sqlite3.Connection
+        connection
+
+    Notes
+    ------
+    1. Registers `cuc_to(value, 'psi => kPa')` and `cuc_from_to(value, 'psi', 'kPa')`.
+    2. Blocks are parsed and resolved once per distinct block string.
+    3. NULL values return NULL.
+    4. Registered families (see `register_family`) are converted row by row with their scalar kernel.
+
+    Examples
+    --------
+    >>> pycuc.register_sqlite(conn, pycuc.go(reference_file=...))
+    >>> conn.execute("SELECT cuc_to(p, 'psi => kPa') FROM readings")
+    '''
+    try:
+        # converter
+        converter = shared_converter() if converter is None else converter
+        # compiled blocks
+        compile_block = converter.compile_block
+
+        def cuc_to(value, block):
+            # null
+            if value is None:
+                return None
+            # plugin families
+            if converter._families:
+                res = converter._block_family(block)
+                if res is not None:
+                    from_unit, to_unit, family = res
+                    return family.scalar(value, from_unit, to_unit)
+            _, _, scale, offset = compile_block(block)
+            return value * scale + offset
+
+        def cuc_from_to(value, from_unit, to_unit):
+            # null
+            if value is None:
+                return None
+            # plugin families
+            if converter._families:
+                family = converter._plugin_family(from_unit, to_unit)
+                if family is not None:
+                    return family.scalar(value, from_unit, to_unit)
+            scale, offset = converter.conversion_factors(from_unit, to_unit)
+            return value * scale + offset
+
+        # register
+        conn.create_function(name, 2, cuc_to, deterministic=True)
+        conn.create_function(from_to_name, 3, cuc_from_to, deterministic=True)
+
+        return conn
+    except Exception as e:
+        raise Exception('Registering sqlite functions failed!, ', e)
+
+
+def register_duckdb(conn, converter=None, name='cuc_to'):
+    '''
+    Registers a vectorized unit conversion function on a duckdb connection
+
+    Parameters
+    ----------
+    conn : duckdb.DuckDBPyConnection
+        connection
+    converter : CustomUnitConverterX, optional
+        converter (default: shared converter)
+    name : str
+        function name (default: cuc_to)
+
+    Returns
+    -------
+    duckdb.DuckDBPyConnection
+        connection
+
+    Notes
+    ------
+    1. Registers `cuc_to(value, 'psi => kPa')`, a DOUBLE function.
+    2. With pyarrow installed the function receives whole vectors and converts them with arrow compute kernels, otherwise it is called per row.
+    3. Registered families (see `register_family`) use their own kernels.
+
+    Examples
+    --------
+    >>> pycuc.register_duckdb(conn, pycuc.go(reference_file=...))
+    >>> conn.sql("SELECT cuc_to(p, 'psi => kPa') FROM readings")
+    '''
+    try:
+        try:
+            from duckdb.sqltypes import DOUBLE, VARCHAR
+        except ImportError:
+            from duckdb.typing import DOUBLE, VARCHAR
+
+        # converter
+        converter = shared_converter() if converter is None else converter
+        # compiled blocks
+        compile_block = converter.compile_block
+
+        # vectorized (arrow)
+        if load_pyarrow():
+            pa, pc = arrowx.pa, arrowx.pc
+
+            def convert_block(values, block):
+                # plugin families
+                if converter._families:
+                    res = converter._block_family(block)
+                    if res is not None:
+                        from_unit, to_unit, family = res
+                        return family.convert(values, from_unit, to_unit)
+                _, _, scale, offset = compile_block(block)
+                return convert_arrow(values, scale, offset)
+
+            def cuc_to(values, blocks):
+                # distinct blocks in this vector (usually one)
+                distinct = pc.unique(blocks).to_pylist()
+
+                # one block
+                if len(distinct) == 1:
+                    if distinct[0] is None:
+                        return pa.nulls(len(values), pa.float64())
+                    return convert_block(pc.cast(values, pa.float64()), distinct[0])
+
+                # several blocks
+                values = pc.cast(values, pa.float64())
+                res = pa.nulls(len(values), pa.float64())
+                for block in distinct:
+                    if block is None:
+                        continue
+                    res = pc.if_else(pc.equal(blocks, block),
+                                     convert_block(values, block), res)
+                return res
+
+            conn.create_function(name, cuc_to, [DOUBLE, VARCHAR], DOUBLE,
+                                 type='arrow')
+        else:
+            def cuc_to(value, block):
+                # plugin families
+                if converter._families:
+                    res = converter._block_family(block)
+                    if res is not None:
+                        from_unit, to_unit, family = res
+                        return family.scalar(value, from_unit, to_unit)
+                _, _, scale, offset = compile_block(block)
+                return value * scale + offset
+
+            conn.create_function(name, cuc_to, [DOUBLE, VARCHAR], DOUBLE)
+
+        return conn
+    except Exception as e:
+        raise Exception('Registering duckdb functions failed!, ', e)
@@ -0,0 +1,182 @@
+# RECORD STREAM CONVERSION
+# =========================
+
+# import packages/modules
+import sys
+import json
+from itertools import islice
+import numpy as np
+
+
+def parse_path(path):
+    '''
+    Parses a JSON path such as `$.sensor.pressure` or `readings.0.value`
+
+    Parameters
+    ----------
+    path : str
+        dotted path, integer segments index lists
+
+    Returns
+    -------
+    tuple
+        path segments
+    '''
+    # set
+    path = str(path).strip()
+    if path.startswith('$'):
+        path = path[1:].lstrip('.')
+
+    # check
+    if len(path) == 0:
+        raise ValueError('Empty field path')
+
+    return tuple(int(seg) if seg.isdigit() else seg for seg in path.split('.'))
+
+
+def _locate(record, path):
+    '''
+    Returns the container and key of a field, or None if it is missing
+    '''
+    node = record
+    for seg in path[:-1]:
+        try:
+            node = node[seg]
+        except (KeyError, IndexError, TypeError):
+            return None
+    key = path[-1]
+    try:
+        node[key]
+    except (KeyError, IndexError, TypeError):
+        return None
+    return node, key
+
+
+class RecordConverter:
+    '''
+    Converts fields of JSON records with a compiled field -> unit schema
+
+    Parameters
+    ----------
+    fields : list
+        `(path, ufunc)` pairs, see `CustomUnitConverterX.record_converter`
+    batch_size : int
+        records converted per batch when streaming
+    '''
+
+    def __init__(self, fields, batch_size=1024):
+        # check
+        if batch_size < 1:
+            raise ValueError('batch_size must be positive')
+
+        self.fields = list(fields)
+        self.batch_size = int(batch_size)
+
+    def __repr__(self):
+        blocks = ', '.join(
+            f"{'.'.join(map(str, path))}: {ufunc.__name__}" for path, ufunc in self.fields)
+        return f'<pycuc RecordConverter {{{blocks}}}>'
+
+    def convert_records(self, records):
+        '''
+        Converts a batch of records in place, one vectorized call per field
+
+        Parameters
+        ----------
+        records : list
+            decoded JSON records (dict)
+
+        Returns
+        -------
+        list
+            records
+
+        Notes
+        ------
+        1. Missing fields, nulls and non-numeric values are left unchanged.
+        '''
+        try:
+            for path, ufunc in self.fields:
+                # collect
+                slots = []
+                values = []
+                for record in records:
+                    slot = _locate(record, path)
+                    if slot is None:
+                        continue
+                    value = slot[0][slot[1]]
+                    if isinstance(value, (int, float)) and not isinstance(value, bool):
+                        slots.append(slot)
+                        values.append(value)
+
+                # check
+                if not values:
+                    continue
+
+                # convert
+                res = ufunc(np.asarray(values, dtype=np.float64)).tolist()
+
+                # write back
+                for (node, key), value in zip(slots, res):
+                    node[key] = value
+
+            return records
+        except Exception as e:
+            raise Exception('Converting records failed!, ', e)
+
+    def stream(self, src, dst):
+        '''
+        Converts a newline-delimited JSON stream batch by batch
+
+        Parameters
+        ----------
+        src : str | file
+            NDJSON file path, '-' for stdin, or a text file object
+        dst : str | file
+            NDJSON file path, '-' for stdout, or a text file object
+
+        Returns
+        -------
+        int
+            number of records
+
+        Notes
+        ------
+        1. At most `batch_size` records are held in memory.
+        2. Blank lines are skipped.
+        '''
+        try:
+            # open
+            fin = sys.stdin if src == '-' else (
+                open(src, 'r', encoding='utf-8') if isinstance(src, str) else src)
+            fout = sys.stdout if dst == '-' else (
+                open(dst, 'w', encoding='utf-8') if isinstance(dst, str) else dst)
+
+            try:
+                n = 0
+                lines = (line for line in fin if line.strip())
+                while True:
+                    # batch
+                    batch = [json.loads(line)
+                             for line in islice(lines, self.batch_size)]
+                    if not batch:
+                        break
+
+                    # convert
+                    self.convert_records(batch)
+
+                    # write
+                    fout.write(''.join(json.dumps(record, separators=(',', ':')) + '\n'
+                                       for record in batch))
+                    n += len(batch)
+
+                fout.flush()
+                return n
+            finally:
+                # close own files
+                if isinstance(src, str) and fin is not sys.stdin:
+                    fin.close()
+                if isinstance(dst, str) and fout is not sys.stdout:
+                    fout.close()
+        except Exception as e:
+            raise Exception('Streaming records failed!, ', e)
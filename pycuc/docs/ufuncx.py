@@ -0,0 +1,188 @@
+# UNIT UFUNC
+# ===========
+
+# import packages/modules
+from functools import partial
+import numpy as np
+# local
+from .arrayx import convert_array
+from .arrowx import is_arrow, is_arrow_series, convert_arrow, convert_arrow_series
+
+
+def _module_of(value):
+    '''
+    Returns the top-level module name of the value type
+    '''
+    return type(value).__module__.split('.')[0]
+
+
+def _is_numeric(dtype):
+    '''
+    Checks if a dtype holds real numbers (booleans and complex numbers are not numbers here)
+    '''
+    return np.issubdtype(dtype, np.number) and not np.issubdtype(dtype, np.complexfloating)
+
+
+class UnitUfunc:
+    '''
+    A compiled unit conversion that behaves like a numpy ufunc
+
+    The conversion is resolved once to `value * scale + offset`, so it can be
+    mapped over numpy arrays, dask arrays (lazily, block by block) and xarray
+    objects (chunking is preserved, `attrs['units']` is checked and updated).
+    '''
+
+    # ufunc-like signature
+    nin = 1
+    nout = 1
+    nargs = 2
+
+    def __init__(self, from_unit, to_unit, scale, offset=0.0, family=None):
+        self.from_unit = from_unit
+        self.to_unit = to_unit
+        self.scale = float(scale)
+        self.offset = float(offset)
+        # plugin family (nonlinear kernels)
+        self.family = family
+        self.__name__ = f'{from_unit} => {to_unit}'
+
+    def __repr__(self):
+        return f"<pycuc ufunc '{self.__name__}'>"
+
+    def __call__(self, x, out=None, dtype=None):
+        '''
+        Converts the values
+
+        Parameters
+        ----------
+        x : float | numpy.ndarray | dask.array.Array | xarray.DataArray | xarray.Dataset
+            values
+        out : numpy.ndarray, optional
+            output array for numpy values
+        dtype : str | numpy.dtype, optional
+            output dtype (not for arrow values)
+
+        Returns
+        -------
+        same type as x
+            converted values
+        '''
+        try:
+            # module
+            module = _module_of(x)
+
+            # xarray
+            if module == 'xarray':
+                return self._apply_xarray(x, dtype)
+
+            # dask
+            if module == 'dask':
+                return self._apply_dask(x, dtype)
+
+            # check (arrow kernels keep their own types)
+            if dtype is not None and (is_arrow(x) or is_arrow_series(x)):
+                raise ValueError('dtype is not supported for arrow values')
+
+            # plugin family
+            if self.family is not None:
+                return self.family.convert(x, self.from_unit, self.to_unit, out=out, dtype=dtype)
+
+            # arrow
+            if is_arrow(x):
+                return convert_arrow(x, self.scale, self.offset)
+            if is_arrow_series(x):
+                return convert_arrow_series(x, self.scale, self.offset)
+
+            # scalar
+            if out is None and dtype is None and np.ndim(x) == 0 and not isinstance(x, np.ndarray):
+                return float(x) * self.scale + self.offset
+
+            # numpy
+            return convert_array(x, self.scale, self.offset, out=out, dtype=dtype)
+        except Exception as e:
+            raise Exception(f'Applying {self.__name__} failed!, ', e)
+
+    def _kernel(self, block, dtype=None):
+        '''
+        Converts a numpy block (used by dask/xarray)
+        '''
+        if self.family is not None:
+            return self.family.convert_array(block, self.from_unit, self.to_unit, dtype=dtype)
+        return convert_array(block, self.scale, self.offset, dtype=dtype)
+
+    def _result_dtype(self, dtype, dtype_in):
+        '''
+        Returns the output dtype
+        '''
+        if dtype is not None:
+            return np.dtype(dtype)
+        if np.issubdtype(dtype_in, np.floating):
+            return np.dtype(dtype_in)
+        return np.dtype(np.float64)
+
+    def _apply_dask(self, x, dtype=None):
+        '''
+        Maps the conversion lazily over dask blocks
+        '''
+        # dtype
+        dtype = self._result_dtype(dtype, x.dtype)
+
+        return x.map_blocks(partial(self._kernel, dtype=dtype), dtype=dtype,
+                            meta=np.empty((0,) * x.ndim, dtype=dtype))
+
+    def _check_units(self, x):
+        '''
+        Checks `attrs['units']` of an xarray DataArray against the from unit
+        '''
+        units = x.attrs.get('units')
+        if units is not None and str(units).strip() != self.from_unit:
+            raise ValueError(
+                f"values in {units!r}, expected {self.from_unit!r}")
+
+    def _apply_xarray(self, x, dtype=None):
+        '''
+        Applies the conversion to an xarray DataArray/Dataset
+
+        Notes
+        ------
+        1. A DataArray with `attrs['units']` must be in the from unit, other units raise.
+        2. Only Dataset variables tagged with the from unit are converted, the others (other units, untagged, flags, labels) are kept as they are.
+        '''
+        import xarray as xr
+
+        # dataset: convert the data variables in the from unit
+        if isinstance(x, xr.Dataset):
+            # check all variables first
+            names = []
+            for name, da in x.data_vars.items():
+                units = da.attrs.get('units')
+                if units is None or str(units).strip() != self.from_unit:
+                    continue
+                if not _is_numeric(da.dtype):
+                    raise TypeError(f'variable {name!r} is not numeric ({da.dtype})')
+                names.append(name)
+
+            res = x.copy(deep=False)
+            for name in names:
+                res[name] = self._apply_xarray(x[name], dtype)
+            return res
+
+        # check
+        self._check_units(x)
+        if not _is_numeric(x.dtype):
+            raise TypeError(f'values are not numeric ({x.dtype})')
+
+        # dtype
+        out_dtype = self._result_dtype(dtype, x.dtype)
+
+        # apply (dask arrays stay lazy, one task per chunk)
+        res = xr.apply_ufunc(self._kernel, x,
+                             kwargs={'dtype': out_dtype},
+                             dask='parallelized',
+                             output_dtypes=[out_dtype],
+                             keep_attrs=True)
+
+        # units
+        res.attrs['units'] = self.to_unit
+
+        return res
@@ -0,0 +1,138 @@
+# UNIT ARRAY
+# ===========
+
+# import packages/modules
+import numpy as np
+# local
+from .arrayx import convert_array
+from .cucx import shared_converter
+
+
+class UnitArray:
+    '''
+    A numpy array tagged with its unit, converted lazily
+
+    `to` only resolves the affine map from the unit of the stored data to the
+    target unit, so a chain of conversions (`psi => bar => kPa => MPa`) is
+    applied in one pass when the values are accessed, without intermediate
+    arrays or rounding of intermediate steps.
+
+    Parameters
+    ----------
+    values : array_like
+        values
+    unit : str
+        unit of the values
+    registry : CustomUnitConverterX, optional
+        converter (default: shared converter)
+    '''
+
+    __slots__ = ('_data', '_data_unit', 'unit', '_scale',
+                 '_offset', '_reference', '_values', '_registry')
+
+    def __init__(self, values, unit, registry=None):
+        # data (not copied)
+        self._data = np.asarray(values)
+        self._data_unit = str(unit).strip()
+        self.unit = self._data_unit
+        # pending map: data * scale + offset
+        self._scale = 1.0
+        self._offset = 0.0
+        self._reference = None
+        # materialized values
+        self._values = self._data
+        self._registry = shared_converter() if registry is None else registry
+
+    def __repr__(self):
+        state = 'pending' if self._values is None else 'materialized'
+        return f'UnitArray({self.shape}, {self.unit!r}, {state})'
+
+    def __len__(self):
+        return len(self._data)
+
+    @property
+    def shape(self):
+        return self._data.shape
+
+    @property
+    def registry(self):
+        return self._registry
+
+    @property
+    def pending(self):
+        '''
+        Pending affine map `(scale, offset)` from the stored data
+        '''
+        return self._scale, self._offset
+
+    def to(self, to_unit, reference=None):
+        '''
+        Returns the array in another unit (lazy)
+
+        Parameters
+        ----------
+        to_unit : str
+            to unit
+        reference : str
+            reference name such as pressure, temperature, custom
+
+        Returns
+        -------
+        UnitArray
+            array sharing the same data with an updated pending map
+        '''
+        try:
+            # set
+            to_unit = str(to_unit).strip()
+
+            # same unit
+            if to_unit == self.unit:
+                return self
+
+            # plugin families (nonlinear): materialize, then convert
+            registry = self._registry
+            if registry._families:
+                family = registry._plugin_family(
+                    self.unit, to_unit, reference)
+                if family is not None:
+                    return UnitArray(family.convert_array(self.values, self.unit, to_unit),
+                                     to_unit, registry)
+
+            # map from the data unit (one map for the whole chain)
+            res = UnitArray.__new__(UnitArray)
+            res._data = self._data
+            res._data_unit = self._data_unit
+            res.unit = to_unit
+            res._reference = reference if reference is not None else self._reference
+            if to_unit == self._data_unit:
+                res._scale, res._offset = 1.0, 0.0
+                res._values = self._data
+            else:
+                res._scale, res._offset = registry.conversion_factors(
+                    self._data_unit, to_unit, res._reference)
+                res._values = None
+            res._registry = registry
+
+            return res
+        except Exception as e:
+            raise Exception('Unit array conversion failed!, ', e)
+
+    @property
+    def values(self):
+        '''
+        Converted values (materialized once)
+        '''
+        if self._values is None:
+            self._values = convert_array(self._data, self._scale, self._offset)
+        return self._values
+
+    def __array__(self, dtype=None, copy=None):
+        values = self.values
+        if dtype is not None and np.dtype(dtype) != values.dtype:
+            return values.astype(dtype)
+        if copy:
+            return values.copy()
+        return values
+
+    def __getitem__(self, index):
+        return self.values[index]
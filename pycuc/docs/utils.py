@@ -1,7 +1,7 @@
 # import module/packages
 import re
-import os
-import yaml
+# local
+from .loaders import load_reference
 
 
 class Utils:
@@ -50,30 +50,19 @@ class Utils:
         Parameters
         ----------
         f : str
-            yml file path
+            reference file path (.yml, .yaml, .json, .toml, .csv)
 
         Returns
         -------
         dict
             custom conversion unit
+
+        Notes
+        ------
+        1. The loader is selected by extension, unknown extensions are sniffed from the content.
+        2. csv files contain `group,unit,factor` rows.
         '''
         try:
-            # custom unit
-            custom_unit = {}
-
-            # check file path
-            if not os.path.exists(f):
-                raise ValueError("File not found")
-
-            # check format
-            if not f.endswith('.yml'):
-                raise ValueError("File format not supported")
-
-            # read yml file
-            with open(f, 'r') as file:
-                custom_unit = yaml.safe_load(file)
-
-            return custom_unit
-
+            return load_reference(f)
         except Exception as e:
             raise Exception('Loading custom conversion unit failed!, ', e)
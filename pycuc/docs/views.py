@@ -0,0 +1,113 @@
+# REFERENCE VIEWS
+# ================
+
+# import packages/modules
+from types import MappingProxyType
+from collections.abc import Mapping
+import numpy as np
+import pandas as pd
+
+
+def readonly_mapping(res):
+    '''
+    Wraps a reference (and its unit groups) in read-only mappings
+
+    Parameters
+    ----------
+    res : dict
+        unit -> factor or group -> {unit: factor}
+
+    Returns
+    -------
+    MappingProxyType
+        read-only view (no copy of the units)
+    '''
+    return MappingProxyType({key: MappingProxyType(value) if isinstance(value, dict) else value
+                             for key, value in res.items()})
+
+
+def readonly_frame(res):
+    '''
+    Builds a reference table backed by read-only arrays
+
+    Parameters
+    ----------
+    res : Mapping
+        unit -> factor or group -> {unit: factor}
+
+    Returns
+    -------
+    pandas.DataFrame
+        `Unit`, `Value` columns (in-place writes raise)
+    '''
+    # columns
+    units = np.array(list(res.keys()), dtype=object)
+    values = list(res.values())
+    if values and all(isinstance(value, Mapping) for value in values):
+        # unit groups
+        values = np.array(values, dtype=object)
+    else:
+        values = np.array(values)
+
+    # lock
+    units.flags.writeable = False
+    values.flags.writeable = False
+
+    return pd.DataFrame({'Unit': units, 'Value': values}, copy=False)
+
+
+class ReferenceViews:
+    '''
+    Reference tables cached per registry version
+
+    Parameters
+    ----------
+    maxsize : int
+        max number of cached views (cleared when full)
+    '''
+
+    def __init__(self, maxsize=256):
+        self.maxsize = int(maxsize)
+        # (reference, dataframe) -> (version, view)
+        self._views = {}
+
+    def get(self, key, version, build):
+        '''
+        Returns the cached view of a reference, rebuilt if the registry changed
+
+        Parameters
+        ----------
+        key : tuple
+            (reference, dataframe)
+        version : int
+            registry version counter
+        build : callable
+            `build() -> dict` reference units
+
+        Returns
+        -------
+        MappingProxyType | pandas.DataFrame
+            read-only mapping, or a shallow copy of the cached read-only table
+        '''
+        # cached
+        hit = self._views.get(key)
+        if hit is None or hit[0] != version:
+            # build
+            view = readonly_mapping(build())
+            if key[1]:
+                view = readonly_frame(view)
+
+            # save
+            if len(self._views) >= self.maxsize:
+                self._views.clear()
+            hit = (version, view)
+            self._views[key] = hit
+
+        # frames: private columns over shared read-only data
+        return hit[1].copy(deep=False) if key[1] else hit[1]
+
+    def clear(self):
+        '''
+        Drops all views
+        '''
+        self._views.clear()
@@ -0,0 +1,174 @@
+# REFERENCE FILE WATCHING
+# ========================
+
+# import packages/modules
+import os
+import time
+import threading
+from collections import deque
+
+
+def diff_reference(current, new, owned_groups=()):
+    '''
+    Compares loaded custom units with new reference data
+
+    Parameters
+    ----------
+    current : dict
+        current groups (group -> {unit: factor})
+    new : dict
+        new groups from the reference file (group -> {unit: factor})
+    owned_groups : iterable
+        groups previously loaded from the same file (removed if missing in new)
+
+    Returns
+    -------
+    dict
+        added, changed and removed `(group, unit)` pairs and removed groups
+    '''
+    # diff
+    added = []
+    changed = []
+    removed = []
+
+    for group, units in new.items():
+        old_units = current.get(group, {})
+        for unit, factor in units.items():
+            if unit not in old_units:
+                added.append((group, unit))
+            elif old_units[unit] != factor:
+                changed.append((group, unit))
+        # units removed from a group owned by the file
+        if group in owned_groups:
+            for unit in old_units:
+                if unit not in units:
+                    removed.append((group, unit))
+
+    # groups removed from the file
+    removed_groups = [group for group in owned_groups
+                      if group not in new and group in current]
+    for group in removed_groups:
+        removed.extend((group, unit) for unit in current[group])
+
+    return {
+        'added': added,
+        'changed': changed,
+        'removed': removed,
+        'removed_groups': removed_groups
+    }
+
+
+class ReferenceWatcher:
+    '''
+    Polls a reference file modification time and reloads it on change
+
+    Parameters
+    ----------
+    converter : CustomUnitConverterX
+        converter to update
+    reference_file : str
+        reference file path
+    interval : float
+        polling interval in seconds
+    callback : callable, optional
+        called with the reload event (dict)
+    max_events : int
+        number of recent reload events kept in `events`
+
+    Notes
+    ------
+    1. Reload and callback failures are kept in `error`, polling goes on.
+    '''
+
+    def __init__(self, converter, reference_file, interval=1.0, callback=None, max_events=100):
+        self.converter = converter
+        self.reference_file = reference_file
+        self.interval = float(interval)
+        self.callback = callback
+        # state
+        self.events = deque(maxlen=max_events)
+        self.error = None
+        self._mtime = self._get_mtime()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _get_mtime(self):
+        try:
+            return os.stat(self.reference_file).st_mtime_ns
+        except OSError:
+            return None
+
+    def check(self):
+        '''
+        Reloads the reference file if its modification time changed
+
+        Returns
+        -------
+        dict | None
+            reload event or None if unchanged
+        '''
+        # check
+        mtime = self._get_mtime()
+        if mtime is None or mtime == self._mtime:
+            return None
+
+        try:
+            event = self.converter.reload_custom_unit(self.reference_file)
+            self.error = None
+        except Exception as e:
+            # keep the current units, retry on the next change
+            self.error = e
+            self._mtime = mtime
+            return None
+
+        self._mtime = mtime
+
+        # emit
+        self.events.append(event)
+        if self.callback is not None:
+            try:
+                self.callback(event)
+            except Exception as e:
+                # keep polling
+                self.error = e
+
+        return event
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.check()
+
+    def start(self):
+        '''
+        Starts polling in a daemon thread
+        '''
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name='pycuc-watch', daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        '''
+        Stops polling
+        '''
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+
+def timed(func, *args):
+    '''
+    Calls func and returns (result, elapsed seconds)
+    '''
+    start = time.perf_counter()
+    res = func(*args)
+    return res, time.perf_counter() - start
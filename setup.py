@@ -26,6 +26,9 @@ setup(
     # require files
     package_data={'': ['*.yml']},
     install_requires=['pandas', 'numpy'],
+    entry_points={
+        'console_scripts': ['pycuc=pycuc.cli:main'],
+    },
     keywords=['python', 'chemical engineering', 'custom unit conversion',
               'PyCUC'],
     classifiers=[
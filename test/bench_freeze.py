@@ -0,0 +1,93 @@
+# import packages/modules
+import gc
+import os
+import sys
+import subprocess
+import tempfile
+import pycuc
+from pycuc.docs.frozen import FrozenGroup
+
+# =====================================
+# PRIVATE MEMORY OF FORKED WORKERS
+# =====================================
+# linux only: reads /proc/self/smaps_rollup
+# usage: python test/bench_freeze.py [--freeze | --no-freeze]
+# without a flag both modes run in separate processes and the frozen
+# workers must dirty at most MAX_RATIO of the unfrozen private memory
+GROUPS = 200
+UNITS = 250
+WORKERS = 4
+FROZEN = '--freeze' in sys.argv
+MAX_RATIO = 0.75
+
+
+def private_dirty_kb():
+    with open('/proc/self/smaps_rollup') as f:
+        for line in f:
+            if line.startswith('Private_Dirty:'):
+                return int(line.split()[1])
+    return 0
+
+
+def work(cucx):
+    # touch every unit like a long-running worker would
+    before = private_dirty_kb()
+    for group, units in cucx.check_reference('custom', dataframe=False).items():
+        symbols = list(units)
+        for unit in symbols:
+            cucx.from_to(1.0, symbols[0], unit)
+    return private_dirty_kb() - before
+
+
+# compare both modes
+if '--freeze' not in sys.argv and '--no-freeze' not in sys.argv:
+    res = {}
+    for flag in ('--no-freeze', '--freeze'):
+        out = subprocess.run([sys.executable, __file__, flag], check=True,
+                             capture_output=True, text=True).stdout
+        print(out.strip())
+        res[flag] = float(out.split()[-2])
+    ratio = res['--freeze'] / res['--no-freeze']
+    print(f'frozen / unfrozen: {ratio:.2f} (max {MAX_RATIO})')
+    if ratio > MAX_RATIO:
+        raise SystemExit('freeze does not reduce the private memory of forked workers')
+    sys.exit(0)
+
+with tempfile.TemporaryDirectory() as folder:
+    # catalog
+    path = os.path.join(folder, 'catalog.csv')
+    with open(path, 'w') as f:
+        for g in range(GROUPS):
+            for u in range(UNITS):
+                f.write(f'G{g},u{g}_{u},{1.0 + u / 7!r}\n')
+
+    # master
+    cucx = pycuc.go(reference_file=path)
+    if FROZEN:
+        pycuc.freeze(cucx)
+        # groups are compact buffers, moved out of the collected generations
+        groups = type(cucx)._custom_conversions_full
+        if any(not isinstance(units, FrozenGroup) for units in groups.values()):
+            raise SystemExit('freeze left mutable unit groups')
+        if gc.get_freeze_count() == 0:
+            raise SystemExit('freeze did not move objects to the permanent generation')
+
+    # workers
+    pipes = []
+    for _ in range(WORKERS):
+        r, w = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(r)
+            os.write(w, str(work(cucx)).encode())
+            os._exit(0)
+        os.close(w)
+        pipes.append((pid, r))
+
+    dirty = []
+    for pid, r in pipes:
+        dirty.append(int(os.read(r, 64)))
+        os.waitpid(pid, 0)
+
+    print(f'{GROUPS * UNITS} units, frozen={FROZEN}: '
+          f'private dirty per worker {sum(dirty) / len(dirty):.0f} kB')
@@ -0,0 +1,74 @@
+# import packages/modules
+import os
+import json
+import time
+import tempfile
+import yaml
+from pycuc.docs.loaders import load_reference
+
+# =====================================
+# BENCHMARK REFERENCE FILE LOADERS
+# =====================================
+# catalog size
+GROUPS = 100
+UNITS = 200
+REPEAT = 3
+
+# generated catalog
+catalog = {
+    'CUSTOM-UNIT': {
+        f'GROUP-{g}': {f'u{g}_{u}/mol': 1.0 + u / 7 for u in range(UNITS)}
+        for g in range(GROUPS)
+    }
+}
+
+
+def write_files(folder):
+    # files
+    files = {}
+
+    # yml
+    files['yml'] = os.path.join(folder, 'catalog.yml')
+    with open(files['yml'], 'w') as f:
+        yaml.safe_dump(catalog, f)
+
+    # json
+    files['json'] = os.path.join(folder, 'catalog.json')
+    with open(files['json'], 'w') as f:
+        json.dump(catalog, f)
+
+    # toml
+    files['toml'] = os.path.join(folder, 'catalog.toml')
+    with open(files['toml'], 'w') as f:
+        for group, units in catalog['CUSTOM-UNIT'].items():
+            f.write(f'[CUSTOM-UNIT.{group}]\n')
+            for unit, factor in units.items():
+                f.write(f'"{unit}" = {factor!r}\n')
+
+    # csv
+    files['csv'] = os.path.join(folder, 'catalog.csv')
+    with open(files['csv'], 'w') as f:
+        f.write('group,unit,factor\n')
+        for group, units in catalog['CUSTOM-UNIT'].items():
+            for unit, factor in units.items():
+                f.write(f'{group},{unit},{factor!r}\n')
+
+    return files
+
+
+with tempfile.TemporaryDirectory() as folder:
+    files = write_files(folder)
+
+    print(f'{GROUPS * UNITS} units, best of {REPEAT}')
+    for name, path in files.items():
+        # time
+        best = float('inf')
+        for _ in range(REPEAT):
+            start = time.perf_counter()
+            data = load_reference(path)
+            best = min(best, time.perf_counter() - start)
+
+        # check
+        assert len(data['CUSTOM-UNIT']) == GROUPS
+
+        print(f'{name:>5}: {best * 1000:8.1f} ms')
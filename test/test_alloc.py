@@ -0,0 +1,127 @@
+# import packages/modules
+import sys
+import tracemalloc
+import numpy as np
+import pycuc
+
+# =====================================
+# ALLOCATION BUDGETS OF THE HOT PATHS
+# =====================================
+# usage: python test/test_alloc.py [--verbose]
+# budgets are per call, measured after a warm-up (caches filled)
+CALLS = 2000
+VERBOSE = '--verbose' in sys.argv
+
+# scalar paths: (name, call, peak bytes per call, retained blocks for all calls)
+my_cuc = pycuc.go()
+SCALAR = [
+    ('pycuc.to', lambda: pycuc.to(14.7, 'psi => kPa'), 3072, 16),
+    ('pycuc.convert_from_to', lambda: pycuc.convert_from_to(
+        100, 'C', 'F'), 1536, 16),
+    ('CustomUnitConverterX.from_to', lambda: my_cuc.from_to(
+        1.0, 'bar', 'kPa'), 1536, 16),
+    ('CustomUnitConverterX.to (catalog)', lambda: my_cuc.to(
+        1.0, 'kWh => kJ'), 2560, 16),
+]
+
+# array paths: (name, call(values), peak bytes per input byte)
+ARRAY = [
+    ('CustomUnitConverterX.to (array)', lambda x: my_cuc.to(x, 'psi => kPa'), 1.0),
+    ('CustomUnitConverterX.to (array, in place)',
+     lambda x: my_cuc.to(x, 'psi => kPa', out=x), 0.0),
+    ('UnitUfunc (array)', my_cuc.ufunc('F => C'), 1.0),
+]
+ARRAY_OVERHEAD = 8192
+
+
+def peak_sites(call, *args, limit=5):
+    # allocation sites alive at the peak of a single call (snapshots on each return)
+    filters = [tracemalloc.Filter(False, tracemalloc.__file__),
+               tracemalloc.Filter(False, __file__)]
+    best = [0, None]
+
+    def profile(frame, event, arg):
+        if event in ('return', 'c_return'):
+            current = tracemalloc.get_traced_memory()[0]
+            if current > best[0]:
+                best[0] = current
+                best[1] = tracemalloc.take_snapshot()
+
+    tracemalloc.start(10)
+    try:
+        previous = tracemalloc.take_snapshot()
+        sys.setprofile(profile)
+        try:
+            call(*args)
+        finally:
+            sys.setprofile(None)
+    finally:
+        tracemalloc.stop()
+
+    # check
+    if best[1] is None:
+        return []
+    stats = best[1].filter_traces(filters).compare_to(
+        previous.filter_traces(filters), 'lineno')
+    return [str(stat) for stat in stats[:limit] if stat.size_diff > 0]
+
+
+def measure(call, *args):
+    # warm up (resolved factors and compiled blocks are cached)
+    for _ in range(10):
+        call(*args)
+
+    # peak of a single call
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+        call(*args)
+        peak = tracemalloc.get_traced_memory()[1] - base
+    finally:
+        tracemalloc.stop()
+
+    return peak
+
+
+def retained_blocks(call):
+    # blocks still allocated after many calls (leaks, unbounded caches)
+    call()
+    before = sys.getallocatedblocks()
+    for _ in range(CALLS):
+        call()
+    return sys.getallocatedblocks() - before
+
+
+failed = []
+
+# scalar
+for name, call, peak_budget, block_budget in SCALAR:
+    peak = measure(call)
+    blocks = retained_blocks(call)
+    ok = peak <= peak_budget and blocks <= block_budget
+    print(f'{"ok  " if ok else "FAIL"} {name}: peak {peak} B/call (budget {peak_budget}), '
+          f'retained {blocks} blocks/{CALLS} calls (budget {block_budget})')
+    if not ok or VERBOSE:
+        print('\n'.join(f'     {site}' for site in peak_sites(call)))
+    if not ok:
+        failed.append(name)
+
+# arrays
+for size in (10_000, 1_000_000):
+    for name, call, ratio in ARRAY:
+        values = np.linspace(0, 100, size)
+        peak = measure(call, values)
+        budget = ratio * values.nbytes + ARRAY_OVERHEAD
+        ok = peak <= budget
+        print(f'{"ok  " if ok else "FAIL"} {name} [{size}]: peak {peak} B '
+              f'({peak / values.nbytes:.2f} x input, budget {budget:.0f})')
+        if not ok or VERBOSE:
+            print('\n'.join(f'     {site}' for site in peak_sites(call, values)))
+        if not ok:
+            failed.append(f'{name} [{size}]')
+
+# check
+if failed:
+    raise SystemExit(f'allocation budgets exceeded: {", ".join(failed)}')
+print('all allocation budgets met')
@@ -0,0 +1,258 @@
+# import packages/modules
+import os
+import sys
+import math
+import random
+import sqlite3
+import tempfile
+import numpy as np
+import pycuc
+from pycuc.docs import CustomUnitConverter
+from pycuc.docs.refs import Refs
+
+# =====================================
+# DIFFERENTIAL CONFORMANCE
+# =====================================
+# every accelerated entry point must match the reference scalar semantics of
+# CustomUnitConverter (convert_pressure, convert_temperature, convert_custom)
+# usage: python test/test_conformance.py [--seed N] [--cases N]
+#
+# tolerance: |fast - ref| <= ULPS * spacing(m), with m the largest magnitude of
+# the intermediate terms of the reference. The compiled paths fold
+# `value / a * b` into `value * (b / a)`: the rounding of `value / a` is
+# relative and carries over to the result, so m = |ref|. Temperatures are one
+# affine map in the compiled paths while the reference rounds at the magnitude
+# of `(value - 491.67) * 5/9`, so m also includes |value|, |offset| and the
+# temperature constants of both units. Round trips (A => B => A) get twice the
+# budget at |value| (and at |ref|, |offset| and the constants for temperatures).
+ULPS = 8
+TINY = np.finfo(float).tiny
+
+
+def arg(name, default):
+    if name in sys.argv:
+        return int(sys.argv[sys.argv.index(name) + 1])
+    return default
+
+
+SEED = arg('--seed', 20240601)
+CASES = arg('--cases', 300)
+rng = random.Random(SEED)
+
+# edge values (finite edges stay far from overflow/underflow of the factors)
+EDGES = [0.0, -0.0, 1.0, -1.0, 1e-300, -1e-300, 1e300, -1e300,
+         math.nan, math.inf, -math.inf]
+
+
+def random_value():
+    # mixed magnitudes, signs and exact integers
+    kind = rng.random()
+    if kind < 0.1:
+        return rng.choice(EDGES)
+    if kind < 0.2:
+        return float(rng.randint(-1000, 1000))
+    return rng.choice((-1, 1)) * 10 ** rng.uniform(-12, 12)
+
+
+def random_group(index):
+    # random YAML group: unit -> factor (log-uniform)
+    units = {f'u{index}_{i}': 10 ** rng.uniform(-6, 6)
+             for i in range(rng.randint(2, 8))}
+    units[f'u{index}_0'] = 1.0
+    return f'G{index}', units
+
+
+def close(fast, ref, mag, ulps=ULPS):
+    # nan/inf must match exactly
+    if math.isnan(ref) or math.isnan(fast):
+        return math.isnan(ref) and math.isnan(fast)
+    if math.isinf(ref) or math.isinf(fast):
+        return fast == ref
+    return abs(fast - ref) <= ulps * np.spacing(max(abs(ref), abs(mag)))
+
+
+# reference file with random groups
+folder = tempfile.TemporaryDirectory()
+reference_file = os.path.join(folder.name, 'random-units.yml')
+groups = dict(random_group(i) for i in range(8))
+# custom group named like a catalog family
+groups['ENERGY'] = {'J/mol': 1.0, 'kJ/mol': 0.001, 'cal/mol': 0.239006}
+with open(reference_file, 'w') as f:
+    f.write('CUSTOM-UNIT:\n')
+    for group, units in groups.items():
+        f.write(f'  {group}:\n')
+        for unit, factor in units.items():
+            f.write(f'    {unit}: {factor!r}\n')
+
+# reference (scalar) and accelerated converters
+refC = CustomUnitConverter('', '')
+refC.load_custom_unit(reference_file)
+my_cuc = pycuc.go(reference_file=reference_file)
+
+# unit pairs
+PAIRS = [(a, b) for a in Refs._pressure_conversions_ref for b in Refs._pressure_conversions_ref]
+PAIRS += [(a, b) for a in Refs._temperature_conversions_ref
+          for b in Refs._temperature_conversions_ref]
+PAIRS += [(a, b) for units in groups.values() for a in units for b in units]
+
+
+
+def magnitude(x, ref, offset, consts):
+    # intermediate magnitude of the reference (see tolerance)
+    if offset == 0 and consts == 0:
+        return abs(ref)
+    return max(abs(ref), abs(x), abs(offset), consts)
+
+
+def reference(value, from_unit, to_unit):
+    return CustomUnitConverter(value, from_unit).convert(to_unit)
+
+
+# accelerated entry points: name -> f(values, from_unit, to_unit) -> list
+conn = sqlite3.connect(':memory:')
+pycuc.register_sqlite(conn, my_cuc)
+
+ENTRY_POINTS = {
+    'from_to': lambda xs, a, b: [my_cuc.from_to(x, a, b) for x in xs],
+    'pycuc.to': lambda xs, a, b: [pycuc.to(x, f'{a} => {b}', reference_file=reference_file)
+                                  for x in xs],
+    'Quantity.to': lambda xs, a, b: [pycuc.Quantity(x, a, my_cuc).to(b).value for x in xs],
+    'conversion_factors': lambda xs, a, b: [x * s + o for s, o in
+                                            [my_cuc.conversion_factors(a, b)] for x in xs],
+    'to (numpy)': lambda xs, a, b: my_cuc.to(np.array(xs), f'{a} => {b}').tolist(),
+    'to (numpy, in place)': lambda xs, a, b: my_cuc.to(np.array(xs), f'{a} => {b}',
+                                                       out=np.empty(len(xs))).tolist(),
+    'ufunc': lambda xs, a, b: my_cuc.ufunc(f'{a} => {b}')(np.array(xs)).tolist(),
+    'record_converter': lambda xs, a, b: [r['v'] for r in my_cuc.record_converter(
+        {'v': f'{a} => {b}'}).convert_records([{'v': x} for x in xs])],
+    'sqlite': lambda xs, a, b: [conn.execute('SELECT cuc_to(?, ?)', (x, f'{a} => {b}')).fetchone()[0]
+                                for x in xs],
+}
+
+
+def convert_file(xs, a, b):
+    # .npy through memory maps
+    src = os.path.join(folder.name, 'values.npy')
+    dst = os.path.join(folder.name, 'values-converted.npy')
+    np.save(src, np.array(xs))
+    my_cuc.convert_file(src, dst, f'{a} => {b}')
+    return np.load(dst).tolist()
+
+
+ENTRY_POINTS['convert_file'] = convert_file
+
+# optional: arrow
+try:
+    import pyarrow as pa
+    import pandas as pd
+    ENTRY_POINTS['to (arrow)'] = lambda xs, a, b: my_cuc.to(
+        pa.array(xs), f'{a} => {b}').to_pylist()
+    ENTRY_POINTS['to (arrow series)'] = lambda xs, a, b: my_cuc.to(
+        pd.Series(pd.arrays.ArrowExtensionArray(pa.array(xs))), f'{a} => {b}').to_list()
+except ImportError:
+    pass
+
+# optional: duckdb
+try:
+    import duckdb
+    duck = duckdb.connect()
+    pycuc.register_duckdb(duck, my_cuc)
+    ENTRY_POINTS['duckdb'] = lambda xs, a, b: [
+        duck.execute('SELECT cuc_to(?::DOUBLE, ?)', [x, f'{a} => {b}']).fetchone()[0] for x in xs]
+except ImportError:
+    pass
+
+# optional: dask and xarray (through ufunc)
+try:
+    import dask.array as dsa
+    ENTRY_POINTS['ufunc (dask)'] = lambda xs, a, b: my_cuc.ufunc(f'{a} => {b}')(
+        dsa.from_array(np.array(xs), chunks=4)).compute().tolist()
+except ImportError:
+    pass
+try:
+    import xarray as xr
+    ENTRY_POINTS['ufunc (xarray)'] = lambda xs, a, b: my_cuc.ufunc(f'{a} => {b}')(
+        xr.DataArray(np.array(xs), attrs={'units': a})).values.tolist()
+except ImportError:
+    pass
+
+failures = []
+checked = 0
+
+for case in range(CASES):
+    # case
+    from_unit, to_unit = rng.choice(PAIRS)
+    values = [random_value() for _ in range(rng.randint(1, 16))]
+    scale, offset = my_cuc.conversion_factors(from_unit, to_unit)
+    consts = max(abs(Refs._temperature_conversions_ref.get(unit, 0))
+                 for unit in (from_unit, to_unit))
+    refs = [reference(x, from_unit, to_unit) for x in values]
+
+    for name, entry in ENTRY_POINTS.items():
+        # sqlite has no nan (NULL)
+        xs = [x for x in values if not (name == 'sqlite' and math.isnan(x))]
+        rs = [r for x, r in zip(values, refs) if not (name == 'sqlite' and math.isnan(x))]
+        if not xs:
+            continue
+
+        res = entry(xs, from_unit, to_unit)
+        for x, fast, ref in zip(xs, res, rs):
+            checked += 1
+            if not close(fast, ref, magnitude(x, ref, offset, consts)):
+                failures.append((case, name, from_unit, to_unit, x, fast, ref))
+
+    # round trip (A => B => A) on the compiled path
+    back = my_cuc.to(my_cuc.to(np.array(values), f'{from_unit} => {to_unit}'),
+                     f'{to_unit} => {from_unit}').tolist()
+    for x, fast, ref in zip(values, back, refs):
+        checked += 1
+        # the intermediate overflowed or went subnormal: its precision is gone
+        if (math.isinf(ref) and not math.isinf(x)) or 0 < abs(ref) < TINY:
+            continue
+        if not close(fast, x, magnitude(ref, x, offset, consts), 2 * ULPS):
+            failures.append((case, 'round trip', from_unit, to_unit, x, fast, x))
+
+# memory layouts: convert_file keeps C and Fortran ordered .npy files intact
+grid = np.arange(-6.0, 6.0).reshape(3, 4)
+for order in 'CF':
+    src = os.path.join(folder.name, f'grid-{order}.npy')
+    dst = os.path.join(folder.name, f'grid-{order}-kPa.npy')
+    np.save(src, np.asarray(grid, order=order))
+    my_cuc.convert_file(src, dst, 'psi => kPa')
+    res = np.load(dst)
+    for x, fast in zip(grid.ravel(), res.ravel()):
+        checked += 1
+        ref = reference(float(x), 'psi', 'kPa')
+        if not close(float(fast), ref, abs(ref)):
+            failures.append((-1, f'convert_file ({order} order)', 'psi', 'kPa',
+                             float(x), float(fast), ref))
+
+# empty raw files convert to empty files
+src = os.path.join(folder.name, 'empty.bin')
+dst = os.path.join(folder.name, 'empty-kPa.bin')
+open(src, 'wb').close()
+if my_cuc.convert_file(src, dst, 'psi => kPa') != 0 or os.path.getsize(dst) != 0:
+    failures.append((-1, 'convert_file (empty)', 'psi', 'kPa', math.nan, math.nan, 0.0))
+
+# bounds of a custom group named like a catalog family (custom factors, not the catalog)
+my_cuc.set_bounds('ENERGY', 'J/mol', 0, None)
+res, ok = my_cuc.to(np.array([-1.0, 2.0]), 'kJ/mol => J/mol', bounds='mask')
+if res.tolist() != [-1000.0, 2000.0] or ok.tolist() != [False, True]:
+    failures.append((-1, 'bounds (custom ENERGY)', 'kJ/mol', 'J/mol', -1.0, float(res[0]), -1000.0))
+# the catalog ENERGY family keeps its own (unset) bounds
+res, ok = my_cuc.to(np.array([-1.0]), 'kWh => kJ', bounds='mask')
+if not ok.all():
+    failures.append((-1, 'bounds (catalog ENERGY)', 'kWh', 'kJ', -1.0, float(res[0]), -3600.0))
+
+folder.cleanup()
+
+# report
+print(f'seed {SEED}: {CASES} cases, {checked} values, {len(ENTRY_POINTS)} entry points '
+      f'({", ".join(ENTRY_POINTS)})')
+for case, name, from_unit, to_unit, x, fast, ref in failures[:20]:
+    diff = abs(fast - ref) / np.spacing(abs(ref)) if math.isfinite(fast - ref) else math.inf
+    print(f'FAIL case {case} [{name}] {x!r} {from_unit} => {to_unit}: '
+          f'{fast!r} != {ref!r} ({diff:.1f} ulp)')
+if failures:
+    raise SystemExit(f'{len(failures)} conformance failures (seed {SEED})')
+print('all entry points conform')